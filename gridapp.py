@@ -19,16 +19,21 @@ import json
 import math
 import sys
 import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, ClassVar, Dict, Iterable, List, Optional, Set
 
 from PySide6.QtCore import (
     QEvent,
+    QLineF,
     QPoint,
     QPointF,
     QRectF,
     QSize,
+    QSizeF,
     Qt,
     Signal,
     QTimer,
@@ -45,6 +50,8 @@ from PySide6.QtGui import (
     QIcon,
     QImage,
     QPixmap,
+    QStaticText,
+    QTransform,
 )
 from PySide6.QtWidgets import (
     QApplication,
@@ -89,17 +96,50 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtSvg import QSvgGenerator
 
+try:
+    from PySide6.QtGui import QOpenGLContext, QSurfaceFormat
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # PySide6 built without OpenGL support
+    QOpenGLWidget = None
+
 
 # ----------------------------- Config ---------------------------------
+# Specs are created per placed item; drop the instance __dict__ where supported
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 GRID_CELLS = 1000  # 1000x1000
 CELL_SIZE = 20    # pixels per cell (zoom lets you navigate efficiently)
 GRID_COLOR = Qt.gray
 GRID_THICK_COLOR = Qt.darkGray
 BACKGROUND_COLOR = Qt.white
+GRID_PEN = QPen(QColor(GRID_COLOR), 1)
+GRID_THICK_PEN = QPen(QColor(GRID_THICK_COLOR), 2)
+GRID_TILE_MIN_PX = 256   # grid tiles span whole 10-cell blocks and at least this many device pixels
+GRID_TILE_MAX_PX = 2048  # beyond this (deep zoom) the grid is drawn as lines
+GRID_TILE_CACHE_SIZE = 8  # tiles kept for recently used zoom levels
+GRID_HIDE_CELL_PX = 1.0   # on-screen cell size below which no grid is drawn
+GRID_FINE_CELL_PX = 3.0   # on-screen cell size below which only thick lines are drawn
+SCENE_BSP_MIN_OBJECTS = 50  # placed objects above which the scene keeps a BSP index
+OBJECT_POOL_SIZE = 64  # removed map objects kept for reuse by later placements
 
 
-@dataclass
-class ObjectSpec:
+class _SizedSpec:
+    """Footprint and list label shared by object and zone specs."""
+
+    __slots__ = ()
+
+    def pixel_size(self, cell_size: int) -> tuple[int, int]:
+        return self.size_w * cell_size, self.size_h * cell_size
+
+    def label(self) -> str:
+        key = (self.name, self.size_w, self.size_h)
+        if key != self._label_key:
+            self._label_key = key
+            self._label = f"{self.name}  ({self.size_w}x{self.size_h})"
+        return self._label
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class ObjectSpec(_SizedSpec):
     name: str
     size_w: int = 1  # width in cells
     size_h: int = 1  # height in cells
@@ -107,19 +147,23 @@ class ObjectSpec:
     limit: Optional[int] = None
     limit_key: Optional[str] = None
     template_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    _label_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _label: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.limit_key is None:
             self.limit_key = self.name
 
 
-@dataclass
-class ZoneSpec:
+@dataclass(**_DATACLASS_SLOTS)
+class ZoneSpec(_SizedSpec):
     name: str
     size_w: int = 1
     size_h: int = 1
     fill: QColor = field(default_factory=lambda: QColor(255, 0, 0, 60))
     edge: QColor = field(default_factory=lambda: QColor(Qt.red))
+    _label_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _label: str = field(default="", init=False, repr=False, compare=False)
 
 
 RANK_ORDER = ["R1", "R2", "R3", "R4", "R5"]
@@ -300,9 +344,58 @@ def fit_text_item_to_rect(
     if not text:
         return
 
+    current_font = item.font()
+    font = fit_font_to_rect(
+        current_font, text, width, height, min_point_size=min_point_size, padding=padding
+    )
+    if abs(current_font.pointSizeF() - font.pointSizeF()) <= 0.01:
+        return
+    item.setFont(font)
+
+
+def fit_font_to_rect(
+    font: QFont,
+    text: str,
+    width: float,
+    height: float,
+    *,
+    min_point_size: float = 4.0,
+    padding: float = 4.0,
+) -> QFont:
+    """Return a copy of font sized so text fits inside width/height."""
+
     available_width = max(1.0, width - 2.0 * padding)
     available_height = max(1.0, height - 2.0 * padding)
-    base_font = item.font()
+    base_font = QFont(font)
+    # The search never reads the current size, so leave it out of the cache key
+    base_font.setPointSizeF(12.0)
+    font_key = base_font.toString()
+    best = _fitted_point_size(
+        font_key, text, available_width, available_height, min_point_size
+    )
+    return sized_font(max(min_point_size, best), font_key)
+
+
+@lru_cache(maxsize=256)
+def sized_font(point_size: float, font_key: str = "") -> QFont:
+    """Font at point_size, shared by every label using it; copy before changing it."""
+    font = QFont()
+    if font_key:
+        font.fromString(font_key)
+    font.setPointSizeF(point_size)
+    return font
+
+
+@lru_cache(maxsize=1024)
+def _fitted_point_size(
+    font_key: str,
+    text: str,
+    available_width: float,
+    available_height: float,
+    min_point_size: float,
+) -> float:
+    base_font = QFont()
+    base_font.fromString(font_key)
     low = min_point_size
     high = max(low, min(200.0, min(available_width, available_height)))
     best = low
@@ -319,10 +412,14 @@ def fit_text_item_to_rect(
             low = mid
         else:
             high = mid
+    return best
+
 
-    final_font = QFont(base_font)
-    final_font.setPointSizeF(max(min_point_size, best))
-    item.setFont(final_font)
+def group_by_footprint(items: Iterable) -> dict[tuple[int, int], list]:
+    groups: dict[tuple[int, int], list] = {}
+    for item in items:
+        groups.setdefault((item.spec.size_w, item.spec.size_h), []).append(item)
+    return groups
 
 
 def create_color_icon(color: QColor, size: int = 16) -> QIcon:
@@ -353,98 +450,392 @@ def create_zone_icon(fill: QColor, edge: QColor, size: int = 16) -> QIcon:
     return QIcon(pixmap)
 
 
+def choose_color(initial: QColor, parent: Optional[QWidget], title: str) -> QColor:
+    """Like QColorDialog.getColor, but reuses the main window's dialog."""
+    window = parent
+    while window is not None and not isinstance(window, MainWindow):
+        window = window.parentWidget()
+    if window is None:
+        window = QApplication.activeWindow()
+    if isinstance(window, MainWindow):
+        return window.pick_color(initial, title, parent)
+    return QColorDialog.getColor(initial, parent, title)
+
+
+# ----------------------------- Spatial Index ---------------------------
+class _QuadNode:
+    __slots__ = ("bounds", "depth", "entries", "children")
+
+    def __init__(self, x1: float, y1: float, x2: float, y2: float, depth: int):
+        self.bounds = (x1, y1, x2, y2)
+        self.depth = depth
+        self.entries: list = []
+        self.children: Optional[list[_QuadNode]] = None
+
+
+class QuadTree:
+    """Region quadtree over item rects; items straddling a split stay on the parent node."""
+
+    def __init__(self, rect: QRectF, max_items: int = 8, max_depth: int = 8):
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self._where: dict = {}
+        self.reset(rect)
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def reset(self, rect: QRectF) -> None:
+        self._root = _QuadNode(rect.left(), rect.top(), rect.right(), rect.bottom(), 0)
+        self._where = {}
+
+    def insert(self, item, rect: QRectF) -> None:
+        if item in self._where:
+            self.remove(item)
+        box = (rect.left(), rect.top(), rect.right(), rect.bottom())
+        root = self._root
+        rx1, ry1, rx2, ry2 = root.bounds
+        if box[0] < rx1 or box[1] < ry1 or box[2] > rx2 or box[3] > ry2:
+            # Outside the map (e.g. mid-drag); keep it where every query looks
+            root.entries.append((item, box))
+            self._where[item] = root
+            return
+        self._insert(root, item, box)
+
+    def remove(self, item) -> None:
+        node = self._where.pop(item, None)
+        if node is None:
+            return
+        entries = node.entries
+        for index, (entry_item, _box) in enumerate(entries):
+            if entry_item is item:
+                del entries[index]
+                break
+
+    def contains(self, item) -> bool:
+        return item in self._where
+
+    def query(self, rect: QRectF) -> list:
+        return list(self._overlapping(rect))
+
+    def first_overlap(self, rect: QRectF, ignore=None):
+        """Return the first indexed item intersecting rect other than ignore, or None."""
+        for item in self._overlapping(rect):
+            if item is not ignore:
+                return item
+        return None
+
+    def _overlapping(self, rect: QRectF):
+        qx1 = rect.left()
+        qy1 = rect.top()
+        qx2 = rect.right()
+        qy2 = rect.bottom()
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            for item, (x1, y1, x2, y2) in node.entries:
+                if x1 < qx2 and qx1 < x2 and y1 < qy2 and qy1 < y2:
+                    yield item
+            if node.children is not None:
+                for child in node.children:
+                    x1, y1, x2, y2 = child.bounds
+                    if x1 < qx2 and qx1 < x2 and y1 < qy2 and qy1 < y2:
+                        stack.append(child)
+
+    def _insert(self, node: _QuadNode, item, box: tuple) -> None:
+        while node.children is not None:
+            child = self._child_for(node, box)
+            if child is None:
+                break
+            node = child
+        node.entries.append((item, box))
+        self._where[item] = node
+        if (
+            node.children is None
+            and len(node.entries) > self.max_items
+            and node.depth < self.max_depth
+        ):
+            self._split(node)
+
+    @staticmethod
+    def _child_for(node: _QuadNode, box: tuple) -> Optional[_QuadNode]:
+        x1, y1, x2, y2 = node.bounds
+        mid_x = (x1 + x2) / 2.0
+        mid_y = (y1 + y2) / 2.0
+        if box[2] <= mid_x:
+            col = 0
+        elif box[0] >= mid_x:
+            col = 1
+        else:
+            return None
+        if box[3] <= mid_y:
+            row = 0
+        elif box[1] >= mid_y:
+            row = 1
+        else:
+            return None
+        return node.children[row * 2 + col]
+
+    def _split(self, node: _QuadNode) -> None:
+        x1, y1, x2, y2 = node.bounds
+        mid_x = (x1 + x2) / 2.0
+        mid_y = (y1 + y2) / 2.0
+        depth = node.depth + 1
+        node.children = [
+            _QuadNode(x1, y1, mid_x, mid_y, depth),
+            _QuadNode(mid_x, y1, x2, mid_y, depth),
+            _QuadNode(x1, mid_y, mid_x, y2, depth),
+            _QuadNode(mid_x, mid_y, x2, y2, depth),
+        ]
+        entries = node.entries
+        node.entries = []
+        for item, box in entries:
+            self._insert(node, item, box)
+
+
 # ----------------------------- Map Items -------------------------------
-class MapObject(QGraphicsItemGroup):
+class LabelItem(QGraphicsSimpleTextItem):
+    """Simple text item that keeps its laid-out text between paints."""
+
+    def __init__(self, text: str = "", parent: Optional[QGraphicsItem] = None):
+        super().__init__(text, parent)
+        self._static_text: Optional[QStaticText] = None
+
+    def setText(self, text: str) -> None:
+        super().setText(text)
+        self._static_text = None
+
+    def setFont(self, font: QFont) -> None:
+        super().setFont(font)
+        self._static_text = None
+
+    def paint(self, painter: QPainter, option, widget=None):
+        static_text = self._static_text
+        if static_text is None:
+            static_text = self._static_text = QStaticText(self.text())
+            static_text.setTextFormat(Qt.PlainText)
+        painter.setFont(self.font())
+        painter.setPen(self.brush().color())
+        painter.drawStaticText(0, 0, static_text)
+
+
+class MapObject(QGraphicsItem):
+    """Placed object; paints its box and label itself instead of via child items."""
+
     def __init__(self, spec: ObjectSpec, top_left: QPointF, cell_size: int):
         super().__init__()
         self.spec = spec
         self.cell_size = cell_size
+        self._cached_rect: Optional[QRectF] = None
         self._last_valid_pos = QPointF(top_left)
 
-        w = spec.size_w * cell_size
-        h = spec.size_h * cell_size
-        rect_item = QGraphicsRectItem(0, 0, w, h)
-        rect_item.setBrush(QBrush(spec.fill))
-        rect_item.setPen(QPen(Qt.black, 1))
-
-        label = QGraphicsSimpleTextItem(spec.name)
-        label.setBrush(Qt.black)
-        font = QFont()
-        font.setPointSizeF(max(8.0, cell_size * 0.5))
-        label.setFont(font)
-        fit_text_item_to_rect(label, w, h)
-        label_rect = label.boundingRect()
-        label.setPos((w - label_rect.width()) / 2, (h - label_rect.height()) / 2)
-
-        self.addToGroup(rect_item)
-        self.addToGroup(label)
-        self.rect_item = rect_item
-        self.label_item = label
+        w, h = spec.pixel_size(cell_size)
+        self._rect = QRectF(0, 0, w, h)
+        self._bounds = QRectF()
+        self._pen = QPen(Qt.black, 1)
+        self._label_font = QFont()
+        self._label_text = QStaticText(spec.name)
+        self._label_text.setTextFormat(Qt.PlainText)
+        self._label_pos = QPointF()
+        self._label_size = QSizeF()
+        # Text and pixel footprint the label was last fitted to
+        self._label_key: Optional[tuple] = None
         self._detail_visible = True
+        self.updateLabelLayout()
 
         self.setFlags(
             QGraphicsItem.ItemIsMovable
             | QGraphicsItem.ItemIsSelectable
             | QGraphicsItem.ItemSendsGeometryChanges
         )
+        # Panning blits the cached raster; edits call update() to refresh it
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.setAcceptHoverEvents(True)
 
         # Ensure above any future overlays; grid is drawn in background
         self.setZValue(1000)
         self.setPos(top_left)
 
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    def _update_bounds(self) -> None:
+        # Room for the 2px outline used at detail zoom, plus any label text
+        # too long to fit the box at the minimum font size
+        bounds = self._rect.adjusted(-1, -1, 1, 1)
+        if self._detail_visible and self._label_text.text():
+            bounds = bounds.united(QRectF(self._label_pos, self._label_size))
+        if bounds != self._bounds:
+            self.prepareGeometryChange()
+            self._bounds = bounds
+
+    def paint(self, painter: QPainter, option, widget=None):
+        painter.setPen(self._pen)
+        painter.setBrush(self.spec.fill)
+        painter.drawRect(self._rect)
+        if self._detail_visible:
+            painter.setFont(self._label_font)
+            painter.setPen(Qt.black)
+            painter.drawStaticText(self._label_pos, self._label_text)
+        if option is not None and option.state & QStyle.State_Selected:
+            # Same outline QGraphicsItemGroup draws for selected items
+            outline = self.boundingRect()
+            painter.setBrush(Qt.NoBrush)
+            painter.setPen(QPen(option.palette.window(), 0))
+            painter.drawRect(outline)
+            painter.setPen(QPen(option.palette.windowText(), 0, Qt.DashLine))
+            painter.drawRect(outline)
+
     def bounding_rect_scene(self) -> QRectF:
-        w = self.spec.size_w * self.cell_size
-        h = self.spec.size_h * self.cell_size
-        return QRectF(self.pos().x(), self.pos().y(), w, h)
+        rect = self._cached_rect
+        if rect is None:
+            pos = self.pos()
+            w, h = self.spec.pixel_size(self.cell_size)
+            rect = self._cached_rect = QRectF(pos.x(), pos.y(), w, h)
+        return rect
+
+    def _invalidate_rect(self) -> None:
+        self._cached_rect = None
+
+    def apply_size(self) -> None:
+        """Match the box and label to spec size at the current cell size."""
+        w, h = self.spec.pixel_size(self.cell_size)
+        resized = w != self._rect.width() or h != self._rect.height()
+        if resized:
+            # boundingRect() follows in updateLabelLayout
+            self._rect = QRectF(0, 0, w, h)
+        self._invalidate_rect()
+        self.updateLabelLayout()
+        if resized:
+            scene = self.scene()
+            if isinstance(scene, MapScene):
+                scene._reindex_object(self)
+
+    def set_name(self, name: str) -> None:
+        self.spec.name = name
+        self.updateLabelLayout()
+
+    def set_fill(self, color: QColor) -> None:
+        self.spec.fill = QColor(color)
+        self.update()
+
+    def reset(self, spec: ObjectSpec, top_left: QPointF, cell_size: int) -> None:
+        """Reuse a removed object for a new placement."""
+        self.spec = spec
+        self.cell_size = cell_size
+        self.setSelected(False)
+        self._label_key = None
+        self.apply_size()
+        self.setPos(top_left)
+        self._last_valid_pos = QPointF(top_left)
+        self._drag_start_pos = QPointF(top_left)
+
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            if self._cached_rect is not None:
+                self._cached_rect.moveTo(value)
+            scene = self.scene()
+            if isinstance(scene, MapScene):
+                scene._reindex_object(self)
+        return super().itemChange(change, value)
 
     def mousePressEvent(self, event):
         self._drag_start_pos = QPointF(self.pos())
         super().mousePressEvent(event)
 
     def updateLabelLayout(self):
-        w = self.spec.size_w * self.cell_size
-        h = self.spec.size_h * self.cell_size
-        fit_text_item_to_rect(self.label_item, w, h)
-        label_rect = self.label_item.boundingRect()
-        self.label_item.setPos((w - label_rect.width()) / 2, (h - label_rect.height()) / 2)
+        w, h = self.spec.pixel_size(self.cell_size)
+        text = self.spec.name
+        key = (text, w, h)
+        if key == self._label_key:
+            return
+        self._label_key = key
+        font = fit_font_to_rect(self._label_font, text, w, h) if text else self._label_font
+        # Fitted fonts are shared per size, so identity tells whether the text
+        # needs laying out again or only re-centring
+        if (
+            text != self._label_text.text()
+            or font is not self._label_font
+            or not self._label_size.isValid()
+        ):
+            self._label_text.setText(text)
+            self._label_font = font
+            self._label_text.prepare(QTransform(), font)
+            self._label_size = self._label_text.size()
+        size = self._label_size
+        self._label_pos = QPointF((w - size.width()) / 2, (h - size.height()) / 2)
+        self._update_bounds()
+        self.update()
 
     def set_detail_visible(self, visible: bool) -> None:
         if self._detail_visible == visible:
             return
         self._detail_visible = visible
-        self.label_item.setVisible(visible)
-        pen = self.rect_item.pen()
-        pen.setWidth(2 if visible else 1)
-        self.rect_item.setPen(pen)
+        self._pen.setWidth(2 if visible else 1)
+        self._update_bounds()
+        self.update()
 
     def mouseDoubleClickEvent(self, event):
-        self._prompt_rename()
+        # The form opens after the click is handled, so no modal loop runs inside it
+        spec = self.spec
+        QTimer.singleShot(0, lambda: self._prompt_edit(spec))
         super().mouseDoubleClickEvent(event)
 
+    def _prompt_edit(self, spec: Optional[ObjectSpec] = None):
+        scene = self.scene()
+        # A deferred prompt is dropped if the object was removed or reused meanwhile
+        if scene is None or (spec is not None and self.spec is not spec):
+            return False
+        max_size = scene.cells if isinstance(scene, MapScene) else GRID_CELLS
+        # Name, colour and size share one modal form
+        dialog = SpecEditDialog(
+            self.spec, self._dialog_parent(), "Edit object", max_size, limits=False
+        )
+        if dialog.exec() != QDialog.Accepted:
+            return False
+        values = dialog.values()
+        changed = False
+        # A resize with no room rejects the whole edit, so try it first
+        if (values["size_w"], values["size_h"]) != (self.spec.size_w, self.spec.size_h):
+            if not self._resize_to(values["size_w"], values["size_h"]):
+                return False
+            changed = True
+        if values["name"] != self.spec.name:
+            self.set_name(values["name"])
+            changed = True
+        if values["fill"] != self.spec.fill:
+            self._change_fill(values["fill"])
+            changed = True
+        return changed
+
+    def _dialog_parent(self) -> Optional[QWidget]:
+        # Parented dialogs are modal to the map window and share its colour picker
+        scene = self.scene()
+        views = scene.views() if scene is not None else []
+        return views[0].window() if views else None
+
     def _prompt_rename(self):
         new_name, ok = QInputDialog.getText(
-            None, "Edit object", "Enter name:", text=self.label_item.text()
+            None, "Edit object", "Enter name:", text=self.spec.name
         )
         if ok and new_name.strip():
-            final_name = new_name.strip()
-            self.spec.name = final_name
-            self.label_item.setText(final_name)
-            self.updateLabelLayout()
+            self.set_name(new_name.strip())
             return True
         return False
 
     def _prompt_change_color(self):
-        color = QColorDialog.getColor(self.spec.fill, None, "Choose color")
+        color = choose_color(self.spec.fill, self._dialog_parent(), "Choose color")
         if not color.isValid():
             return False
 
-        new_fill = QColor(color)
-        if new_fill == self.spec.fill:
+        if color == self.spec.fill:
             return False
 
-        self.spec.fill = new_fill
-        self.rect_item.setBrush(QBrush(self.spec.fill))
+        self._change_fill(color)
+        return True
+
+    def _change_fill(self, color: QColor) -> None:
+        self.set_fill(color)
 
         scene = self.scene()
         if scene is not None:
@@ -466,7 +857,6 @@ class MapObject(QGraphicsItemGroup):
                         and getattr(scene.active_spec, "template_id", None) == template_id
                     ):
                         main_window.refresh_active_preview_if(scene.active_spec)
-        return True
 
     def _prompt_resize(self):
         scene = self.scene()
@@ -474,8 +864,6 @@ class MapObject(QGraphicsItemGroup):
         if isinstance(scene, MapScene):
             max_size = scene.cells
 
-        old_w = self.spec.size_w
-        old_h = self.spec.size_h
         width, ok_w = QInputDialog.getInt(
             None,
             "Width",
@@ -497,26 +885,27 @@ class MapObject(QGraphicsItemGroup):
 
         if not (ok_w and ok_h):
             return False
+        return self._resize_to(width, height)
 
+    def _resize_to(self, width: int, height: int) -> bool:
+        scene = self.scene()
+        old_w = self.spec.size_w
+        old_h = self.spec.size_h
         self.spec.size_w = width
         self.spec.size_h = height
         if isinstance(scene, MapScene):
             self.cell_size = scene.cell_size
-        w = self.spec.size_w * self.cell_size
-        h = self.spec.size_h * self.cell_size
-        self.rect_item.setRect(0, 0, w, h)
-        self.updateLabelLayout()
+        self.apply_size()
         if isinstance(scene, MapScene):
             scene.snap_items_to_grid([self])
+            scene._reindex_object(self)
             if not scene.is_object_position_free(self):
                 self.spec.size_w = old_w
                 self.spec.size_h = old_h
                 self.cell_size = scene.cell_size
-                w = self.spec.size_w * self.cell_size
-                h = self.spec.size_h * self.cell_size
-                self.rect_item.setRect(0, 0, w, h)
-                self.updateLabelLayout()
+                self.apply_size()
                 scene.snap_items_to_grid([self])
+                scene._reindex_object(self)
                 QMessageBox.information(
                     None,
                     "Overlap",
@@ -554,17 +943,11 @@ class MapObject(QGraphicsItemGroup):
             map_objects = [item for item in scene.selectedItems() if isinstance(item, MapObject)]
             if not map_objects:
                 map_objects = [self]
-            scene.snap_items_to_grid(map_objects)
-            for obj in map_objects:
-                if not scene.is_object_position_free(obj):
-                    # revert to last valid position
-                    revert_pos = getattr(obj, "_drag_start_pos", obj._last_valid_pos)
-                    obj.setPos(revert_pos)
-                    scene.snap_items_to_grid([obj])
-                    obj._last_valid_pos = QPointF(obj.pos())
-                else:
-                    obj._last_valid_pos = QPointF(obj.pos())
-            scene.update_detail_visibility()
+            # Overlaps are settled now so no invalid layout is ever committed;
+            # only the grid snap of accepted moves waits for the release to repaint
+            accepted = scene.validate_drop(map_objects)
+            if accepted:
+                QTimer.singleShot(0, lambda: scene.finish_drop(accepted))
         else:
             cs = self.cell_size
             current_top_left = self.pos()
@@ -580,39 +963,43 @@ class PreviewObject(QGraphicsItemGroup):
         self.spec = spec
         self.cell_size = cell_size
 
-        w = spec.size_w * cell_size
-        h = spec.size_h * cell_size
-        rect_item = QGraphicsRectItem(0, 0, w, h)
+        rect_item = QGraphicsRectItem()
         rect_item.setBrush(QBrush(spec.fill))
         pen = QPen(Qt.black)
         pen.setStyle(Qt.DashLine)
         rect_item.setPen(pen)
 
-        label = QGraphicsSimpleTextItem(spec.name)
-        font = QFont()
-        font.setPointSizeF(max(8.0, cell_size * 0.5))
-        label.setFont(font)
-        fit_text_item_to_rect(label, w, h)
-        label_rect = label.boundingRect()
-        label.setPos((w - label_rect.width()) / 2, (h - label_rect.height()) / 2)
+        label = LabelItem(spec.name)
 
         self.addToGroup(rect_item)
         self.addToGroup(label)
         self.rect_item = rect_item
         self.label_item = label
+        self._layout()
 
         self.setOpacity(0.4)
         self.setZValue(1_000_000)
         self.setAcceptedMouseButtons(Qt.NoButton)
 
+    def set_spec(self, spec: ObjectSpec, cell_size: int):
+        """Show another spec in place instead of building a new preview."""
+        self.spec = spec
+        self.cell_size = cell_size
+        self.rect_item.setBrush(QBrush(spec.fill))
+        if self.label_item.text() != spec.name:
+            self.label_item.setText(spec.name)
+        self._layout()
+
     def update_for_cell_size(self, cell_size: int):
+        if cell_size == self.cell_size:
+            return
         self.cell_size = cell_size
-        w = self.spec.size_w * cell_size
-        h = self.spec.size_h * cell_size
+        self._layout()
+
+    def _layout(self):
+        w, h = self.spec.pixel_size(self.cell_size)
         self.rect_item.setRect(0, 0, w, h)
-        font = self.label_item.font()
-        font.setPointSizeF(max(8.0, cell_size * 0.5))
-        self.label_item.setFont(font)
+        # fit_text_item_to_rect picks the point size and only resets the font when it changes
         fit_text_item_to_rect(self.label_item, w, h)
         label_rect = self.label_item.boundingRect()
         self.label_item.setPos((w - label_rect.width()) / 2, (h - label_rect.height()) / 2)
@@ -1036,6 +1423,7 @@ class ZoneResizeHandle(QGraphicsRectItem):
         w = width_cells * cs
         h = height_cells * cs
         zone.rect_item.setRect(0, 0, w, h)
+        zone._invalidate_rect()
         zone.setPos(QPointF(left_cells * cs, top_cells * cs))
         zone.updateLabelLayout()
         zone._update_handles_geometry()
@@ -1051,21 +1439,22 @@ class MapZone(QGraphicsItemGroup):
         super().__init__()
         self.spec = spec
         self.cell_size = cell_size
+        self._cached_rect: Optional[QRectF] = None
 
-        w = spec.size_w * cell_size
-        h = spec.size_h * cell_size
+        w, h = spec.pixel_size(cell_size)
 
         rect_item = QGraphicsRectItem(0, 0, w, h)
         rect_item.setBrush(QBrush(spec.fill))
         rect_item.setPen(QPen(spec.edge, 2))
 
-        label = QGraphicsSimpleTextItem(spec.name)
+        label = LabelItem(spec.name)
         label.setBrush(Qt.black)
-        font = QFont()
-        font.setPointSizeF(max(8.0, cell_size * 0.4))
-        label.setFont(font)
+        label.setFont(sized_font(max(8.0, cell_size * 0.4)))
         label_rect = label.boundingRect()
         label.setPos((w - label_rect.width()) / 2, (h - label_rect.height()) / 2)
+        # The zone label keeps its font, so its size only changes with the text
+        self._label_text = spec.name
+        self._label_size = label_rect.size()
 
         self.addToGroup(rect_item)
         self.addToGroup(label)
@@ -1088,15 +1477,30 @@ class MapZone(QGraphicsItemGroup):
         self._detail_handles_enabled = True
 
     def bounding_rect_scene(self) -> QRectF:
-        w = self.spec.size_w * self.cell_size
-        h = self.spec.size_h * self.cell_size
-        return QRectF(self.pos().x(), self.pos().y(), w, h)
+        rect = self._cached_rect
+        if rect is None:
+            pos = self.pos()
+            w, h = self.spec.pixel_size(self.cell_size)
+            rect = self._cached_rect = QRectF(pos.x(), pos.y(), w, h)
+        return rect
+
+    def _invalidate_rect(self) -> None:
+        self._cached_rect = None
+
+    def apply_size(self) -> None:
+        w, h = self.spec.pixel_size(self.cell_size)
+        self.rect_item.setRect(0, 0, w, h)
+        self._invalidate_rect()
+        self.updateLabelLayout()
 
     def updateLabelLayout(self):
-        w = self.spec.size_w * self.cell_size
-        h = self.spec.size_h * self.cell_size
-        label_rect = self.label_item.boundingRect()
-        self.label_item.setPos((w - label_rect.width()) / 2, (h - label_rect.height()) / 2)
+        w, h = self.spec.pixel_size(self.cell_size)
+        text = self.label_item.text()
+        if text != self._label_text:
+            self._label_text = text
+            self._label_size = self.label_item.boundingRect().size()
+        size = self._label_size
+        self.label_item.setPos((w - size.width()) / 2, (h - size.height()) / 2)
         self._update_handles_geometry()
 
     def _create_resize_handles(self):
@@ -1116,8 +1520,7 @@ class MapZone(QGraphicsItemGroup):
     def _update_handles_geometry(self):
         if not self._handles:
             return
-        w = self.spec.size_w * self.cell_size
-        h = self.spec.size_h * self.cell_size
+        w, h = self.spec.pixel_size(self.cell_size)
         for handle in self._handles:
             handle.update_position(w, h)
 
@@ -1136,7 +1539,10 @@ class MapZone(QGraphicsItemGroup):
         self.rect_item.setPen(pen)
 
     def itemChange(self, change, value):
-        if change == QGraphicsItem.ItemSelectedHasChanged:
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            if self._cached_rect is not None:
+                self._cached_rect.moveTo(value)
+        elif change == QGraphicsItem.ItemSelectedHasChanged:
             selected = bool(value)
             self._update_handle_visibility(selected)
             self._set_selection_pen(selected)
@@ -1155,7 +1561,7 @@ class MapZone(QGraphicsItemGroup):
     def _emit_zone_updated(self):
         scene = self.scene()
         if isinstance(scene, MapScene):
-            scene.zone_updated.emit(self)
+            scene._emit_zone_op("updated", self)
 
     def _prompt_rename(self):
         new_name, ok = QInputDialog.getText(
@@ -1170,8 +1576,35 @@ class MapZone(QGraphicsItemGroup):
             return True
         return False
 
+    def _prompt_edit(self, parent: Optional[QWidget] = None):
+        scene = self.scene()
+        max_cells = scene.cells if isinstance(scene, MapScene) else GRID_CELLS
+        dialog = SpecEditDialog(self.spec, parent, "Edit zone", max_cells)
+        if dialog.exec() != QDialog.Accepted:
+            return False
+        old_size = (self.spec.size_w, self.spec.size_h)
+        if not dialog.apply_to(self.spec):
+            return False
+        self.label_item.setText(self.spec.name)
+        self.rect_item.setBrush(QBrush(self.spec.fill))
+        pen = self.rect_item.pen()
+        pen.setColor(self.spec.edge)
+        self.rect_item.setPen(pen)
+        self._update_handle_colors()
+        if (self.spec.size_w, self.spec.size_h) != old_size:
+            if isinstance(scene, MapScene):
+                self.cell_size = scene.cell_size
+            w, h = self.spec.pixel_size(self.cell_size)
+            self.rect_item.setRect(0, 0, w, h)
+            self._invalidate_rect()
+            if isinstance(scene, MapScene):
+                scene.snap_items_to_grid([self])
+        self.updateLabelLayout()
+        self._emit_zone_updated()
+        return True
+
     def _prompt_change_fill(self):
-        fill_color = QColorDialog.getColor(self.spec.fill, None, "Choose fill color")
+        fill_color = choose_color(self.spec.fill, None, "Choose fill color")
         if fill_color.isValid():
             self.spec.fill = QColor(fill_color)
             self.rect_item.setBrush(QBrush(self.spec.fill))
@@ -1180,7 +1613,7 @@ class MapZone(QGraphicsItemGroup):
         return False
 
     def _prompt_change_edge(self):
-        edge_color = QColorDialog.getColor(self.spec.edge, None, "Choose edge color")
+        edge_color = choose_color(self.spec.edge, None, "Choose edge color")
         if edge_color.isValid():
             self.spec.edge = QColor(edge_color)
             pen = self.rect_item.pen()
@@ -1223,10 +1656,7 @@ class MapZone(QGraphicsItemGroup):
         self.spec.size_h = height
         if isinstance(scene, MapScene):
             self.cell_size = scene.cell_size
-        w = self.spec.size_w * self.cell_size
-        h = self.spec.size_h * self.cell_size
-        self.rect_item.setRect(0, 0, w, h)
-        self.updateLabelLayout()
+        self.apply_size()
         self._update_handles_geometry()
         if isinstance(scene, MapScene):
             scene.snap_items_to_grid([self])
@@ -1310,10 +1740,8 @@ class MapZone(QGraphicsItemGroup):
             self.cell_size = scene.cell_size
             cs = self.cell_size
 
-        w = self.spec.size_w * cs
-        h = self.spec.size_h * cs
-        self.rect_item.setRect(0, 0, w, h)
-        self.updateLabelLayout()
+        w, h = self.spec.pixel_size(cs)
+        self.apply_size()
         self._update_handles_geometry()
 
         new_pos = QPointF(x_bl * cs, top_left_y_cells * cs)
@@ -1374,7 +1802,6 @@ class MapZone(QGraphicsItemGroup):
             if not zones:
                 zones = [self]
             scene.snap_items_to_grid(zones)
-            scene.update_detail_visibility()
         else:
             cs = self.cell_size
             current_top_left = self.pos()
@@ -1391,11 +1818,16 @@ class GridLinesItem(QGraphicsItem):
         self.setZValue(500)
         self.setAcceptedMouseButtons(Qt.NoButton)
         self.setFlag(QGraphicsItem.ItemIsSelectable, False)
+        # Without this, option.exposedRect is the whole map on every repaint
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
         self.setAcceptHoverEvents(False)
 
     def update_geometry(self):
+        rect = QRectF(0, 0, self.map_scene.scene_width(), self.map_scene.scene_height())
+        if rect == self._rect:
+            return
         self.prepareGeometryChange()
-        self._rect = QRectF(0, 0, self.map_scene.scene_width(), self.map_scene.scene_height())
+        self._rect = rect
 
     def boundingRect(self) -> QRectF:
         return self._rect
@@ -1407,34 +1839,61 @@ class GridLinesItem(QGraphicsItem):
         if not self.map_scene.show_grid:
             return
         rect = option.exposedRect if option is not None else self._rect
+        # Everything below works on the visible part of the map only
         rect = rect.intersected(self._rect)
+        if rect.isEmpty():
+            return
         cs = self.map_scene.cell_size
-        left = int(math.floor(rect.left() / cs))
-        right = int(math.ceil(rect.right() / cs))
-        top = int(math.floor(rect.top() / cs))
-        bottom = int(math.ceil(rect.bottom() / cs))
-
-        pen_fine = QPen(GRID_COLOR)
-        pen_fine.setWidth(1)
-        painter.setPen(pen_fine)
-        for x in range(left, right + 1):
-            px = x * cs
-            painter.drawLine(px, rect.top(), px, rect.bottom())
-        for y in range(top, bottom + 1):
-            py = y * cs
-            painter.drawLine(rect.left(), py, rect.right(), py)
-
-        pen_thick = QPen(GRID_THICK_COLOR)
-        pen_thick.setWidth(2)
-        painter.setPen(pen_thick)
-        for x in range(left, right + 1):
-            if x % 10 == 0:
-                px = x * cs
-                painter.drawLine(px, rect.top(), px, rect.bottom())
-        for y in range(top, bottom + 1):
-            if y % 10 == 0:
-                py = y * cs
-                painter.drawLine(rect.left(), py, rect.right(), py)
+        cell_px = cs * painter.worldTransform().m11()
+        if cell_px < GRID_HIDE_CELL_PX:
+            return
+        fine = cell_px >= GRID_FINE_CELL_PX
+        if widget is not None and self._paint_tiles(painter, rect, fine):
+            return
+        left = int(rect.left() // cs)
+        right = int(-(-rect.right() // cs))
+        top = int(rect.top() // cs)
+        bottom = int(-(-rect.bottom() // cs))
+
+        x1 = rect.left()
+        x2 = rect.right()
+        y1 = rect.top()
+        y2 = rect.bottom()
+        fine_lines = []
+        if fine:
+            fine_lines = [QLineF(x * cs, y1, x * cs, y2) for x in range(left, right + 1)]
+            fine_lines += [QLineF(x1, y * cs, x2, y * cs) for y in range(top, bottom + 1)]
+        # Thick lines fall on every tenth cell; start at the first multiple of 10
+        thick_columns = range((left + 9) // 10 * 10, right + 1, 10)
+        thick_rows = range((top + 9) // 10 * 10, bottom + 1, 10)
+        thick_lines = [QLineF(x * cs, y1, x * cs, y2) for x in thick_columns]
+        thick_lines += [QLineF(x1, y * cs, x2, y * cs) for y in thick_rows]
+
+        # Axis-aligned lines gain nothing from antialiasing
+        antialiased = painter.testRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        if fine_lines:
+            painter.setPen(GRID_PEN)
+            painter.drawLines(fine_lines)
+        if thick_lines:
+            painter.setPen(GRID_THICK_PEN)
+            painter.drawLines(thick_lines)
+        painter.setRenderHint(QPainter.Antialiasing, antialiased)
+
+    def _paint_tiles(self, painter: QPainter, rect: QRectF, fine: bool) -> bool:
+        device_scale = painter.worldTransform().m11() * painter.device().devicePixelRatioF()
+        if device_scale <= 0:
+            return False
+        cached = self.map_scene.grid_tile(device_scale, fine)
+        if cached is None:
+            return False
+        tile, span = cached
+        # The brush maps one tile onto exactly `span` scene units from the
+        # scene origin, so the whole exposed area is a single fill.
+        brush = QBrush(tile)
+        brush.setTransform(QTransform.fromScale(span / tile.width(), span / tile.height()))
+        painter.fillRect(rect, brush)
+        return True
 
 
 # ----------------------------- Scene/View ------------------------------
@@ -1442,6 +1901,7 @@ class MapScene(QGraphicsScene):
     zone_created = Signal(object)
     zone_updated = Signal(object)
     zone_removed = Signal(object)
+    zones_bulk = Signal(list)
     zone_redraw_finished = Signal(object)
     object_placed = Signal(object)
     object_removed = Signal(object)
@@ -1456,9 +1916,17 @@ class MapScene(QGraphicsScene):
         self.setBackgroundBrush(QBrush(BACKGROUND_COLOR))
         self.setItemIndexMethod(QGraphicsScene.NoIndex)
 
+        # First view showing this scene; set by the main window
+        self.primary_view: Optional[QGraphicsView] = None
+
         # Placement tool state
         self.active_spec: Optional[ObjectSpec] = None
-        self.preview_item: Optional[QGraphicsItemGroup] = None
+        self.preview_item: Optional[PreviewObject] = None
+        self._spare_preview: Optional[PreviewObject] = None
+        # Mouse-move fast path for the preview, rebound by bind_preview_update
+        self._preview_update: Optional[Callable[[QPointF], None]] = None
+        self.grid_item: Optional[GridLinesItem] = None
+        self._grid_tiles: OrderedDict[tuple, Optional[QPixmap]] = OrderedDict()
         self.grid_item = GridLinesItem(self)
         self.addItem(self.grid_item)
         self.grid_item.setVisible(self.show_grid)
@@ -1470,16 +1938,93 @@ class MapScene(QGraphicsScene):
         self.zone_draw_preview: Optional[QGraphicsRectItem] = None
         self.zone_hover_indicator: Optional[QGraphicsRectItem] = None
         self._zone_counter = 0
-        self._zones: list[MapZone] = []
+        self.map_objects: list[MapObject] = []
+        # Removed objects waiting to be reused by create_map_object
+        self._object_pool: list[MapObject] = []
+        self.map_zones: list[MapZone] = []
+        # Spatial index of map objects for overlap queries
+        self._object_index = QuadTree(self.sceneRect(), max_items=8, max_depth=8)
+        self._object_index_dirty = False
+        self._detail_visibility_dirty = False
         self._zone_redraw_target: Optional[MapZone] = None
         self._zone_redraw_hidden_target = False
+        self._batch_depth = 0
+        self._batch_index_method = QGraphicsScene.NoIndex
+        self._pending_zone_ops: list[tuple[str, MapZone]] = []
+        self.sceneRectChanged.connect(self._on_scene_rect_changed)
 
     # --- Helpers ---
+    def grid_tile(self, device_scale: float, fine: bool = True) -> Optional[tuple[QPixmap, int]]:
+        cs = self.cell_size
+        block = cs * 10
+        blocks = max(1, math.ceil(GRID_TILE_MIN_PX / (block * device_scale)))
+        key = (cs, blocks, round(device_scale, 4), fine)
+        tiles = self._grid_tiles
+        if tiles and next(iter(tiles))[0] != cs:
+            # Tiles for another cell size never match again until it returns
+            tiles.clear()
+        if key in tiles:
+            tiles.move_to_end(key)
+            tile = tiles[key]
+        else:
+            tile = tiles[key] = self._build_grid_tile(blocks * block, device_scale, fine)
+            if len(tiles) > GRID_TILE_CACHE_SIZE:
+                tiles.popitem(last=False)
+        if tile is None:
+            return None
+        return tile, blocks * block
+
+    def clear_grid_tiles(self) -> None:
+        self._grid_tiles.clear()
+
+    def update_visible(self) -> None:
+        # Off-screen parts of a large map repaint lazily once scrolled into view
+        for view in self.views():
+            self.update(view.mapToScene(view.viewport().rect()).boundingRect())
+
+    def render_uncached(self, painter: QPainter, target: QRectF, source: QRectF) -> None:
+        # Item caches are device pixmaps; exports must paint the items themselves
+        cached = [(obj, obj.cacheMode()) for obj in self.map_objects]
+        for obj, _ in cached:
+            obj.setCacheMode(QGraphicsItem.NoCache)
+        try:
+            self.render(painter, target, source)
+        finally:
+            for obj, mode in cached:
+                obj.setCacheMode(mode)
+
+    def _build_grid_tile(self, span: int, device_scale: float, fine: bool) -> Optional[QPixmap]:
+        size = round(span * device_scale)
+        if size < 1 or size > GRID_TILE_MAX_PX:
+            return None
+        cs = self.cell_size
+        tile = QPixmap(size, size)
+        tile.fill(Qt.transparent)
+        painter = QPainter(tile)
+        painter.scale(size / span, size / span)
+        if fine:
+            steps = range(0, span + 1, cs)
+            painter.setPen(GRID_PEN)
+            painter.drawLines([QLineF(p, 0, p, span) for p in steps] + [QLineF(0, p, span, p) for p in steps])
+        # Thick lines sit on tile edges; each tile draws its half of them
+        steps = range(0, span + 1, cs * 10)
+        painter.setPen(GRID_THICK_PEN)
+        painter.drawLines([QLineF(p, 0, p, span) for p in steps] + [QLineF(0, p, span, p) for p in steps])
+        painter.end()
+        return tile
+
+    def setSceneRect(self, *args) -> None:
+        super().setSceneRect(*args)
+        # Read by every preview, drag and corner snap; sceneRect() returns a copy
+        rect = self.sceneRect()
+        self._scene_w = float(rect.width())
+        self._scene_h = float(rect.height())
+
     def scene_width(self) -> float:
-        return float(self.sceneRect().width())
+        return self._scene_w
 
     def scene_height(self) -> float:
-        return float(self.sceneRect().height())
+        return self._scene_h
 
     @property
     def detail_cell_threshold(self) -> int:
@@ -1496,6 +2041,93 @@ class MapScene(QGraphicsScene):
     def set_detail_cell_threshold(self, threshold: int) -> None:
         self.detail_cell_threshold = threshold
 
+    @contextmanager
+    def batched_updates(self):
+        """Defer zone signals, indexing and detail updates until the outermost batch exits."""
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self._batch_index_method = self.itemIndexMethod()
+            if self._batch_index_method != QGraphicsScene.NoIndex:
+                self.setItemIndexMethod(QGraphicsScene.NoIndex)
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self._batch_index_method != QGraphicsScene.NoIndex:
+                    self.setItemIndexMethod(self._batch_index_method)
+                if self._object_index_dirty:
+                    self.rebuild_object_index()
+                if self._detail_visibility_dirty:
+                    self._detail_visibility_dirty = False
+                    self.update_detail_visibility()
+                if self._pending_zone_ops:
+                    ops = self._pending_zone_ops
+                    self._pending_zone_ops = []
+                    self.zones_bulk.emit(ops)
+
+    def rebuild_object_index(self) -> None:
+        self._object_index_dirty = False
+        index = self._object_index
+        index.reset(self.sceneRect())
+        for obj in self.map_objects:
+            index.insert(obj, obj.bounding_rect_scene())
+
+    def _reindex_object(self, obj: MapObject) -> None:
+        if self._batch_depth:
+            # Bulk moves rebuild the whole index once the batch ends
+            self._object_index_dirty = True
+        elif self._object_index.contains(obj):
+            self._object_index.insert(obj, obj.bounding_rect_scene())
+
+    def _on_scene_rect_changed(self, rect: QRectF) -> None:  # noqa: ARG002
+        # Items may still be rescaled after the rect changes; rebuild on next use
+        self._object_index_dirty = True
+
+    def create_map_object(self, spec: ObjectSpec, top_left: QPointF) -> MapObject:
+        if self._object_pool:
+            obj = self._object_pool.pop()
+            obj.reset(spec, top_left, self.cell_size)
+            return obj
+        return MapObject(spec, top_left, self.cell_size)
+
+    def add_map_object(self, obj: MapObject) -> None:
+        self.addItem(obj)
+        self.map_objects.append(obj)
+        if self._batch_depth:
+            self._object_index_dirty = True
+        else:
+            self._object_index.insert(obj, obj.bounding_rect_scene())
+        self._update_index_method()
+
+    def _update_index_method(self) -> None:
+        # A handful of items is cheapest to scan; past that, hit tests and view
+        # culling go through Qt's BSP tree. The gap between the thresholds keeps
+        # add/remove near the limit from rebuilding the tree each time.
+        count = len(self.map_objects)
+        current = self._batch_index_method if self._batch_depth else self.itemIndexMethod()
+        if current == QGraphicsScene.NoIndex and count > SCENE_BSP_MIN_OBJECTS:
+            method = QGraphicsScene.BspTreeIndex
+        elif current == QGraphicsScene.BspTreeIndex and count < SCENE_BSP_MIN_OBJECTS // 2:
+            method = QGraphicsScene.NoIndex
+        else:
+            return
+        if self._batch_depth:
+            # Applied when the outermost batch restores indexing
+            self._batch_index_method = method
+        else:
+            self.setItemIndexMethod(method)
+
+    def _emit_zone_op(self, op: str, zone: MapZone) -> None:
+        if self._batch_depth:
+            self._pending_zone_ops.append((op, zone))
+        elif op == "created":
+            self.zone_created.emit(zone)
+        elif op == "updated":
+            self.zone_updated.emit(zone)
+        elif op == "removed":
+            self.zone_removed.emit(zone)
+
     def current_view_rect(self) -> Optional[QRectF]:
         return self._current_view_rect()
 
@@ -1523,54 +2155,117 @@ class MapScene(QGraphicsScene):
         show_objects = self._detail_cell_threshold <= 0 or self.cell_size >= self._detail_cell_threshold
         zone_threshold = max(0, self._detail_cell_threshold - 4)
         show_zones = zone_threshold <= 0 or self.cell_size >= zone_threshold
-        for item in self.items():
-            if isinstance(item, MapObject):
-                item.set_detail_visible(show_objects)
-            elif isinstance(item, MapZone):
-                item.set_detail_visible(show_zones)
+        for item in self.map_objects:
+            item.set_detail_visible(show_objects)
+        for item in self.map_zones:
+            item.set_detail_visible(show_zones)
 
     def _clamp_top_left(self, x: float, y: float, w: float, h: float) -> QPointF:
-        x = max(0, min(self.scene_width() - w, x))
-        y = max(0, min(self.scene_height() - h, y))
+        x = max(0, min(self._scene_w - w, x))
+        y = max(0, min(self._scene_h - h, y))
         return QPointF(x, y)
 
-    def _top_left_from_center_snap(self, scene_pos: QPointF) -> QPointF:
-        cs = self.cell_size
+    def _top_left_cell_from_center(self, scene_pos: QPointF) -> tuple[int, int]:
         spec = self.active_spec
         if spec is None:
-            return QPointF(0, 0)
-        w = spec.size_w * cs
-        h = spec.size_h * cs
-        desired_top_left_x = scene_pos.x() - w / 2
-        desired_top_left_y = scene_pos.y() - h / 2
-        snapped_x = round(desired_top_left_x / cs) * cs
-        snapped_y = round(desired_top_left_y / cs) * cs
-        return self._clamp_top_left(snapped_x, snapped_y, w, h)
-
-    def snap_items_to_grid(self, objects: Iterable[QGraphicsItemGroup]):
+            return 0, 0
+        cs = self.cell_size
+        # Nearest cell to (pos - size / 2), worked in half cells to stay integral
+        cx = (math.floor(scene_pos.x() * 2) // cs - spec.size_w + 1) // 2
+        cy = (math.floor(scene_pos.y() * 2) // cs - spec.size_h + 1) // 2
+        cx = max(0, min(self.cells - spec.size_w, cx))
+        cy = max(0, min(self.cells - spec.size_h, cy))
+        return cx, cy
+
+    def _top_left_from_center_snap(self, scene_pos: QPointF) -> QPointF:
+        cx, cy = self._top_left_cell_from_center(scene_pos)
+        cs = self.cell_size
+        return QPointF(cx * cs, cy * cs)
+
+    def snap_items_to_grid(self, objects: Iterable[QGraphicsItem]):
         cs = self.cell_size
+        cs2 = cs * 2
+        cells = self.cells
+        floor = math.floor
         for obj in objects:
             if not isinstance(obj, (MapObject, MapZone)):
                 continue
             obj.cell_size = cs
-            w = obj.spec.size_w * cs
-            h = obj.spec.size_h * cs
-            current_top_left = obj.pos()
-            snapped_x = round(current_top_left.x() / cs) * cs
-            snapped_y = round(current_top_left.y() / cs) * cs
-            top_left = self._clamp_top_left(snapped_x, snapped_y, w, h)
-            obj.setPos(top_left)
+            obj._invalidate_rect()
+            pos = obj.pos()
+            x = pos.x()
+            y = pos.y()
+            # Nearest cell in integers: floor(x / cs + 0.5)
+            snapped_x = max(0, min(cells - obj.spec.size_w, (floor(x) * 2 + cs) // cs2)) * cs
+            snapped_y = max(0, min(cells - obj.spec.size_h, (floor(y) * 2 + cs) // cs2)) * cs
+            # Items already on the grid need no geometry change or index update
+            if snapped_x != x or snapped_y != y:
+                obj.setPos(snapped_x, snapped_y)
+
+    def snapped_top_left(self, obj: QGraphicsItem) -> QPointF:
+        cs = self.cell_size
+        pos = obj.pos()
+        # Nearest cell in integers: floor(x / cs + 0.5)
+        cx = max(0, min(self.cells - obj.spec.size_w, (math.floor(pos.x()) * 2 + cs) // (cs * 2)))
+        cy = max(0, min(self.cells - obj.spec.size_h, (math.floor(pos.y()) * 2 + cs) // (cs * 2)))
+        return QPointF(cx * cs, cy * cs)
+
+    def validate_drop(self, objects: list[MapObject]) -> list[MapObject]:
+        """Revert dropped objects whose snapped cells are taken; return the rest.
+
+        Accepted objects stay where they were dropped, with _last_valid_pos
+        already set to their snapped cell, until finish_drop() moves them.
+        """
+        targets = [(obj, self.snapped_top_left(obj)) for obj in objects]
+        first, first_target = targets[0]
+        dx = first_target.x() - first.x()
+        dy = first_target.y() - first.y()
+        if any(target.x() - obj.x() != dx or target.y() - obj.y() != dy for obj, target in targets):
+            # Edge clamping changed the group's shape, so members may collide
+            # with each other; snap now and check against the real layout
+            self.snap_items_to_grid(objects)
+            for obj in objects:
+                if self.is_object_position_free(obj):
+                    obj._last_valid_pos = QPointF(obj.pos())
+                else:
+                    self._revert_drop(obj)
+            return []
+        # The group moves rigidly by whole cells, so members cannot collide
+        # with each other; only objects outside the group can block a cell
+        moving = set(objects)
+        accepted = []
+        cs = self.cell_size
+        for obj, target in targets:
+            rect = QRectF(target.x(), target.y(), obj.spec.size_w * cs, obj.spec.size_h * cs)
+            if any(hit not in moving for hit in self._query_objects(rect)):
+                self._revert_drop(obj)
+            else:
+                obj._last_valid_pos = target
+                accepted.append(obj)
+        return accepted
 
-    def is_area_free_for_object(self, rect: QRectF, ignore_item: Optional[QGraphicsItemGroup] = None) -> bool:
-        for item in self.items():
-            if not isinstance(item, MapObject):
-                continue
-            if item is ignore_item:
-                continue
-            item_rect = item.bounding_rect_scene()
-            if rect.intersects(item_rect):
-                return False
-        return True
+    def _revert_drop(self, obj: MapObject) -> None:
+        obj.setPos(getattr(obj, "_drag_start_pos", obj._last_valid_pos))
+        self.snap_items_to_grid([obj])
+        obj._last_valid_pos = QPointF(obj.pos())
+
+    def finish_drop(self, objects: list[MapObject]) -> None:
+        # A drag started meanwhile settles its own drop on release
+        if self.mouseGrabberItem() is not None:
+            return
+        self.snap_items_to_grid([obj for obj in objects if obj.scene() is self])
+
+    def _query_objects(self, rect: QRectF) -> list[MapObject]:
+        # The index stores plain (x1, y1, x2, y2) tuples and already applies
+        # the strict intersection test, so callers need no per-item rects.
+        if self._object_index_dirty:
+            self.rebuild_object_index()
+        return self._object_index.query(rect)
+
+    def is_area_free_for_object(self, rect: QRectF, ignore_item: Optional[QGraphicsItem] = None) -> bool:
+        if self._object_index_dirty:
+            self.rebuild_object_index()
+        return self._object_index.first_overlap(rect, ignore_item) is None
 
     def is_object_position_free(self, obj: MapObject) -> bool:
         rect = obj.bounding_rect_scene()
@@ -1579,33 +2274,79 @@ class MapScene(QGraphicsScene):
     def objects_with_key(self, key: Optional[str]) -> list[MapObject]:
         if not key:
             return []
-        matches: list[MapObject] = []
-        for item in self.items():
-            if isinstance(item, MapObject) and item.spec.limit_key == key:
-                matches.append(item)
-        return matches
+        return [item for item in self.map_objects if item.spec.limit_key == key]
 
     def count_objects_with_key(self, key: Optional[str]) -> int:
         return len(self.objects_with_key(key))
 
     # --- Placement tool API ---
     def set_active_spec(self, spec: Optional[ObjectSpec]):
-        if self.preview_item is not None:
-            self.removeItem(self.preview_item)
-            self.preview_item = None
         self.active_spec = spec
-        if spec is not None:
+        # One preview is kept and restyled; palette browsing allocates nothing
+        if spec is None:
+            if self.preview_item is not None:
+                self.removeItem(self.preview_item)
+                self._spare_preview = self.preview_item
+                self.preview_item = None
+        elif self.preview_item is not None:
+            self.preview_item.set_spec(spec, self.cell_size)
+        elif self._spare_preview is not None:
+            preview = self.preview_item = self._spare_preview
+            self._spare_preview = None
+            preview.set_spec(spec, self.cell_size)
+            # Shown again by the next pointer move over the map
+            preview.setVisible(False)
+            self.addItem(preview)
+        else:
             self.preview_item = PreviewObject(spec, self.cell_size)
             self.addItem(self.preview_item)
+        self.bind_preview_update()
 
     def cancel_placement(self):
         self.set_active_spec(None)
 
+    def bind_preview_update(self) -> None:
+        spec = self.active_spec
+        preview = self.preview_item
+        if spec is None or preview is None:
+            self._preview_update = None
+            return
+        cs = self.cell_size
+        size_w = spec.size_w
+        size_h = spec.size_h
+        max_cx = self.cells - size_w
+        max_cy = self.cells - size_h
+        floor = math.floor
+        last_cx = last_cy = -1
+
+        # Same snapping as _top_left_cell_from_center, with everything it
+        # reads bound up front; rebind whenever the spec or cell size changes.
+        def update(scene_pos: QPointF) -> None:
+            nonlocal last_cx, last_cy
+            cx = (floor(scene_pos.x() * 2) // cs - size_w + 1) // 2
+            cy = (floor(scene_pos.y() * 2) // cs - size_h + 1) // 2
+            if cx > max_cx:
+                cx = max_cx
+            if cx < 0:
+                cx = 0
+            if cy > max_cy:
+                cy = max_cy
+            if cy < 0:
+                cy = 0
+            if cx != last_cx or cy != last_cy:
+                last_cx = cx
+                last_cy = cy
+                preview.setPos(cx * cs, cy * cs)
+
+        self._preview_update = update
+
     def update_preview(self, scene_pos: QPointF):
-        if self.active_spec is None or self.preview_item is None:
+        update = self._preview_update
+        if update is None:
             return
-        self.preview_item.setVisible(True)
-        self.preview_item.setPos(self._top_left_from_center_snap(scene_pos))
+        if not self.preview_item.isVisible():
+            self.preview_item.setVisible(True)
+        update(scene_pos)
 
     @staticmethod
     def _rects_match(rect_a: QRectF, rect_b: QRectF, tol: float = 0.5) -> bool:
@@ -1618,19 +2359,14 @@ class MapScene(QGraphicsScene):
 
     def _analyze_overlaps(self, rect: QRectF) -> tuple[bool, list[MapObject]]:
         exact_matches: list[MapObject] = []
-        for item in self.items():
-            if not isinstance(item, MapObject):
-                continue
-            item_rect = item.bounding_rect_scene()
-            if not rect.intersects(item_rect):
-                continue
-            if self._rects_match(rect, item_rect):
+        for item in self._query_objects(rect):
+            if self._rects_match(rect, item.bounding_rect_scene()):
                 exact_matches.append(item)
             else:
                 return True, []
         return False, exact_matches
 
-    def place_active_at(self, scene_pos: QPointF) -> Optional[QGraphicsItemGroup]:
+    def place_active_at(self, scene_pos: QPointF) -> Optional[QGraphicsItem]:
         if self.active_spec is None:
             return None
         pos = self._top_left_from_center_snap(scene_pos)
@@ -1670,8 +2406,8 @@ class MapScene(QGraphicsScene):
         for item in list(exact_matches):
             if item.scene() is self:
                 self.remove_map_item(item)
-        obj = MapObject(clone_spec(self.active_spec), pos, self.cell_size)
-        self.addItem(obj)
+        obj = self.create_map_object(clone_spec(self.active_spec), pos)
+        self.add_map_object(obj)
         obj.updateLabelLayout()
         obj._last_valid_pos = QPointF(obj.pos())
         self.update_detail_visibility()
@@ -1707,10 +2443,10 @@ class MapScene(QGraphicsScene):
 
     def snap_to_grid_corner(self, scene_pos: QPointF) -> QPointF:
         cs = self.cell_size
-        x = round(scene_pos.x() / cs) * cs
-        y = round(scene_pos.y() / cs) * cs
-        x = max(0, min(self.scene_width(), x))
-        y = max(0, min(self.scene_height(), y))
+        x = (math.floor(scene_pos.x()) * 2 + cs) // (cs * 2) * cs
+        y = (math.floor(scene_pos.y()) * 2 + cs) // (cs * 2) * cs
+        x = max(0, min(self._scene_w, x))
+        y = max(0, min(self._scene_h, y))
         return QPointF(x, y)
 
     def is_drawing_zone(self) -> bool:
@@ -1783,15 +2519,15 @@ class MapScene(QGraphicsScene):
             zone.spec.size_w = width_cells
             zone.spec.size_h = height_cells
             zone.cell_size = self.cell_size
-            w = zone.spec.size_w * self.cell_size
-            h = zone.spec.size_h * self.cell_size
+            w, h = zone.spec.pixel_size(self.cell_size)
             zone.rect_item.setRect(0, 0, w, h)
+            zone._invalidate_rect()
             zone.updateLabelLayout()
             zone._update_handles_geometry()
             clamped = self._clamp_top_left(top_left.x(), top_left.y(), w, h)
             zone.setPos(clamped)
             zone.setVisible(True)
-            self.zone_updated.emit(zone)
+            self._emit_zone_op("updated", zone)
             self.zone_redraw_finished.emit(zone)
             self._zone_redraw_target = None
             self._zone_redraw_hidden_target = False
@@ -1809,8 +2545,8 @@ class MapScene(QGraphicsScene):
         self.addItem(zone)
         zone.updateLabelLayout()
         zone._update_handles_geometry()
-        self._zones.append(zone)
-        self.zone_created.emit(zone)
+        self.map_zones.append(zone)
+        self._emit_zone_op("created", zone)
         self.update_detail_visibility()
         return zone
 
@@ -1848,12 +2584,14 @@ class MapScene(QGraphicsScene):
         self.zone_hover_indicator.setVisible(not self.is_drawing_zone())
 
     def hide_zone_hover(self):
-        if self.zone_hover_indicator is not None:
-            self.zone_hover_indicator.setVisible(False)
+        indicator = self.zone_hover_indicator
+        if indicator is not None and indicator.isVisible():
+            indicator.setVisible(False)
 
     def show_zone_hover(self):
-        if self.zone_hover_indicator is not None:
-            self.zone_hover_indicator.setVisible(True)
+        indicator = self.zone_hover_indicator
+        if indicator is not None and not indicator.isVisible():
+            indicator.setVisible(True)
 
     def update_zone_draw_visuals(self):
         if self.zone_hover_indicator is not None:
@@ -1864,22 +2602,32 @@ class MapScene(QGraphicsScene):
             self.zone_draw_preview.setPen(pen)
             self.zone_draw_preview.setBrush(QBrush(QColor(DEFAULT_ZONE_FILL)))
 
-    def remove_map_item(self, item: QGraphicsItemGroup):
+    def remove_map_item(self, item: QGraphicsItem):
         if isinstance(item, MapObject):
             self.object_removed.emit(item)
+            if item in self.map_objects:
+                self.map_objects.remove(item)
+            self._object_index.remove(item)
+            self._update_index_method()
         self.removeItem(item)
+        if isinstance(item, MapObject) and len(self._object_pool) < OBJECT_POOL_SIZE:
+            self._object_pool.append(item)
         if isinstance(item, MapZone):
-            if item in self._zones:
-                self._zones.remove(item)
-            self.zone_removed.emit(item)
-        self.update_detail_visibility()
+            if item in self.map_zones:
+                self.map_zones.remove(item)
+            self._emit_zone_op("removed", item)
+        if self._batch_depth:
+            self._detail_visibility_dirty = True
+        else:
+            self.update_detail_visibility()
 
     def remove_objects_by_template(self, template_id: str) -> int:
         removed = 0
-        for item in list(self.items()):
-            if isinstance(item, MapObject) and item.spec.template_id == template_id:
-                self.remove_map_item(item)
-                removed += 1
+        with self.batched_updates():
+            for item in list(self.map_objects):
+                if item.spec.template_id == template_id:
+                    self.remove_map_item(item)
+                    removed += 1
         return removed
 
     # --- Painting ---
@@ -1888,30 +2636,57 @@ class MapScene(QGraphicsScene):
         painter.fillRect(rect, QBrush(BACKGROUND_COLOR))
 
 
+def create_gl_viewport() -> Optional[QWidget]:
+    if QOpenGLWidget is None:
+        return None
+    fmt = QSurfaceFormat()
+    fmt.setSamples(0)
+    probe = QOpenGLContext()
+    probe.setFormat(fmt)
+    if not probe.create():
+        return None
+    viewport = QOpenGLWidget()
+    viewport.setFormat(fmt)
+    return viewport
+
+
 class MapView(QGraphicsView):
     def __init__(self, scene: MapScene, parent=None):
         super().__init__(scene, parent)
-        self.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        gl_viewport = create_gl_viewport()
+        if gl_viewport is not None:
+            self.setViewport(gl_viewport)
+        # Map content is axis-aligned rects on whole pixels; only text needs smoothing
+        self.setRenderHints(QPainter.TextAntialiasing)
         self.setDragMode(QGraphicsView.NoDrag)
-        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        # A GL viewport repaints the whole frame anyway, so skip the region bookkeeping
+        self.setViewportUpdateMode(
+            QGraphicsView.FullViewportUpdate
+            if gl_viewport is not None
+            else QGraphicsView.MinimalViewportUpdate
+        )
+        # Item paint() overrides set every painter state they rely on
+        self.setOptimizationFlags(
+            QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing
+        )
+        self.setCacheMode(QGraphicsView.CacheBackground)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorViewCenter)
 
         self._panning = False
         self._pan_start = QPointF()
+        self._prev_update_mode = self.viewportUpdateMode()
         self._rubber_selecting = False
 
-    def _notify_view_changed(self):
-        scene = self.scene()
-        if isinstance(scene, MapScene):
-            scene.update_detail_visibility()
-
     def _map_item_from_graphics_item(
         self, item: Optional[QGraphicsItem]
-    ) -> Optional[QGraphicsItemGroup]:
-        while item is not None and not isinstance(item, (MapObject, MapZone)):
+    ) -> Optional[QGraphicsItem]:
+        # Objects have no children; zone parts and handles sit directly under their zone
+        while item is not None:
+            if isinstance(item, (MapObject, MapZone)):
+                return item
             item = item.parentItem()
-        return item if isinstance(item, (MapObject, MapZone)) else None
+        return None
 
     def wheelEvent(self, event):
         # Zoom on wheel: Ctrl for fine steps
@@ -1921,7 +2696,6 @@ class MapView(QGraphicsView):
         steps = delta / 240
         factor = 1.0 + (0.20 if not (event.modifiers() & Qt.ControlModifier) else 0.05) * steps
         self.scale(factor, factor)
-        self._notify_view_changed()
 
     def mousePressEvent(self, event):
         scene: MapScene = self.scene()
@@ -1991,7 +2765,14 @@ class MapView(QGraphicsView):
             and (event.modifiers() & Qt.ShiftModifier)
             and (item_under_cursor is None or scene.active_spec is not None)
         ):
+            if self._panning:
+                # A second pan button mid-pan keeps the mode saved by the first
+                event.accept()
+                return
             self._panning = True
+            # Panning moves every pixel, so tracking dirty item regions is wasted work
+            self._prev_update_mode = self.viewportUpdateMode()
+            self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
             p = event.position()
             self._pan_start = QPointF(p.x(), p.y())
             self.setCursor(Qt.ClosedHandCursor)
@@ -2002,11 +2783,7 @@ class MapView(QGraphicsView):
     def mouseMoveEvent(self, event):
         scene: MapScene = self.scene()
         if scene.zone_draw_mode:
-            p = event.position()
-            scene_pos = self.mapToScene(int(p.x()), int(p.y()))
-            scene.update_zone_hover(scene_pos)
-            if scene.is_drawing_zone():
-                scene.update_zone_draw(scene_pos)
+            # Hover marker and zone rubber band follow the main window's coalesced move flush
             event.accept()
             return
         if self._panning:
@@ -2015,12 +2792,9 @@ class MapView(QGraphicsView):
             self._pan_start = QPointF(p.x(), p.y())
             self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() - int(delta.x()))
             self.verticalScrollBar().setValue(self.verticalScrollBar().value() - int(delta.y()))
-            self._notify_view_changed()
             event.accept()
             return
-        # Update preview position when moving mouse
-        p = event.position()
-        scene.update_preview(self.mapToScene(int(p.x()), int(p.y())))
+        # The preview follows the pointer through the main window's coalesced move handler
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event):
@@ -2033,6 +2807,7 @@ class MapView(QGraphicsView):
             return
         if self._panning and (event.button() == Qt.MiddleButton or event.button() == Qt.LeftButton):
             self._panning = False
+            self.setViewportUpdateMode(self._prev_update_mode)
             self.setCursor(Qt.ArrowCursor)
             event.accept()
             return
@@ -2041,30 +2816,146 @@ class MapView(QGraphicsView):
             self.setDragMode(QGraphicsView.NoDrag)
             self._rubber_selecting = False
 
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self._notify_view_changed()
-
-    def scrollContentsBy(self, dx: int, dy: int) -> None:
-        super().scrollContentsBy(dx, dy)
-        self._notify_view_changed()
-
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Delete:
             scene: MapScene = self.scene()
-            to_remove: set[QGraphicsItemGroup] = set()
+            to_remove: set[QGraphicsItem] = set()
             for item in scene.selectedItems():
                 map_obj = self._map_item_from_graphics_item(item)
                 if map_obj is not None:
                     to_remove.add(map_obj)
             if to_remove:
-                for obj in to_remove:
-                    scene.remove_map_item(obj)
+                with scene.batched_updates():
+                    for obj in to_remove:
+                        scene.remove_map_item(obj)
                 event.accept()
                 return
         super().keyPressEvent(event)
 
 
+class SpecEditDialog(QDialog):
+    """Edit the name, colours, size and limit of an object or zone spec in one form."""
+
+    def __init__(
+        self,
+        spec,
+        parent: Optional[QWidget] = None,
+        title: str = "Edit object",
+        max_cells: int = GRID_CELLS,
+        limits: bool = True,
+    ):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self._fill = QColor(spec.fill)
+        self._edge: Optional[QColor] = QColor(spec.edge) if isinstance(spec, ZoneSpec) else None
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        layout.addLayout(form)
+
+        self.name_edit = QLineEdit(spec.name, self)
+        form.addRow("Name:", self.name_edit)
+
+        self.fill_button = QPushButton("Choose...", self)
+        self.fill_button.setIcon(create_color_icon(self._fill))
+        self.fill_button.clicked.connect(self._choose_fill)
+        form.addRow("Fill color:" if self._edge is not None else "Color:", self.fill_button)
+
+        self.edge_button: Optional[QPushButton] = None
+        if self._edge is not None:
+            self.edge_button = QPushButton("Choose...", self)
+            self.edge_button.setIcon(create_color_icon(self._edge))
+            self.edge_button.clicked.connect(self._choose_edge)
+            form.addRow("Edge color:", self.edge_button)
+
+        self.width_spin = QSpinBox(self)
+        self.width_spin.setRange(1, max_cells)
+        self.width_spin.setValue(spec.size_w)
+        form.addRow("Width (cells):", self.width_spin)
+
+        self.height_spin = QSpinBox(self)
+        self.height_spin.setRange(1, max_cells)
+        self.height_spin.setValue(spec.size_h)
+        form.addRow("Height (cells):", self.height_spin)
+
+        self.limit_spin: Optional[QSpinBox] = None
+        self.limit_key_edit: Optional[QLineEdit] = None
+        if limits and isinstance(spec, ObjectSpec):
+            self.limit_spin = QSpinBox(self)
+            self.limit_spin.setRange(0, 999999)
+            self.limit_spin.setSpecialValueText("Unlimited")
+            self.limit_spin.setValue(spec.limit or 0)
+            form.addRow("Maximum placements:", self.limit_spin)
+            self.limit_key_edit = QLineEdit(spec.limit_key or spec.name, self)
+            self.limit_key_edit.setToolTip("Objects sharing this key count toward the same limit")
+            self.limit_key_edit.setEnabled(self.limit_spin.value() > 0)
+            self.limit_spin.valueChanged.connect(
+                lambda value: self.limit_key_edit.setEnabled(value > 0)
+            )
+            form.addRow("Shared limit key:", self.limit_key_edit)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def _choose_fill(self) -> None:
+        color = choose_color(self._fill, self, "Choose color")
+        if color.isValid():
+            self._fill = QColor(color)
+            self.fill_button.setIcon(create_color_icon(self._fill))
+
+    def _choose_edge(self) -> None:
+        color = choose_color(self._edge, self, "Choose edge color")
+        if color.isValid():
+            self._edge = QColor(color)
+            self.edge_button.setIcon(create_color_icon(self._edge))
+
+    def accept(self) -> None:
+        if not self.name_edit.text().strip():
+            QMessageBox.information(self, "Missing name", "Enter a name.")
+            self.name_edit.setFocus()
+            return
+        if (
+            self.limit_spin is not None
+            and self.limit_spin.value() > 0
+            and not self.limit_key_edit.text().strip()
+        ):
+            QMessageBox.information(
+                self,
+                "Invalid key",
+                "Limit key cannot be blank when a limit is set.",
+            )
+            self.limit_key_edit.setFocus()
+            return
+        super().accept()
+
+    def values(self) -> dict:
+        name = self.name_edit.text().strip()
+        values = {
+            "name": name,
+            "fill": QColor(self._fill),
+            "size_w": self.width_spin.value(),
+            "size_h": self.height_spin.value(),
+        }
+        if self._edge is not None:
+            values["edge"] = QColor(self._edge)
+        if self.limit_spin is not None:
+            limit = self.limit_spin.value() or None
+            values["limit"] = limit
+            values["limit_key"] = self.limit_key_edit.text().strip() if limit is not None else name
+        return values
+
+    def apply_to(self, spec) -> bool:
+        """Write the edited values into spec; return whether anything changed."""
+        changed = False
+        for attr, value in self.values().items():
+            if getattr(spec, attr) != value:
+                setattr(spec, attr, value)
+                changed = True
+        return changed
+
+
 # ----------------------------- Sidebar --------------------------------
 class PaletteList(QListWidget):
     def __init__(self, specs: list[ObjectSpec], parent=None):
@@ -2072,19 +2963,31 @@ class PaletteList(QListWidget):
         self.specs = specs
         self.setAlternatingRowColors(True)
         self.setIconSize(QSize(20, 20))
-        self.populate()
+        # Rows and icons are built the first time the tab is shown
+        self._populated = False
         self.itemClicked.connect(self._on_item_clicked)
         self.itemDoubleClicked.connect(self._on_item_double_clicked)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self._on_context_menu)
 
     def populate(self):
+        self._populated = True
+        self.setUpdatesEnabled(False)
         self.clear()
         for spec in self.specs:
             self.addItem(self._create_item(spec))
+        self.setUpdatesEnabled(True)
+
+    def _ensure_populated(self) -> None:
+        if not self._populated:
+            self.populate()
+
+    def showEvent(self, event):
+        self._ensure_populated()
+        super().showEvent(event)
 
     def _item_label(self, spec: ObjectSpec) -> str:
-        label = f"{spec.name}  ({spec.size_w}x{spec.size_h})"
+        label = spec.label()
         if spec.limit is not None:
             key_display = spec.limit_key or spec.name
             label += f"  [max {spec.limit} — {key_display}]"
@@ -2101,6 +3004,7 @@ class PaletteList(QListWidget):
         return item
 
     def add_spec(self, spec: ObjectSpec) -> QListWidgetItem:
+        self._ensure_populated()
         if not any(existing is spec for existing in self.specs):
             self.specs.append(spec)
         item = self._create_item(spec)
@@ -2148,7 +3052,7 @@ class PaletteList(QListWidget):
     def _capture_spec_state(self, spec: ObjectSpec) -> dict:
         return {
             "name": spec.name,
-            "fill": QColor(spec.fill),
+            "fill": spec.fill.rgba(),
             "size_w": spec.size_w,
             "size_h": spec.size_h,
             "limit": spec.limit,
@@ -2162,16 +3066,16 @@ class PaletteList(QListWidget):
         previous: dict,
         changed: bool,
     ) -> None:
+        if not changed:
+            # Nothing to redraw: the row, placed objects and preview already match
+            return
         self._refresh_item_display(item, spec)
         w = self.window()
         if isinstance(w, MainWindow):
-            if changed:
-                w.offer_apply_spec_changes(spec, previous)
+            w.offer_apply_spec_changes(spec, previous)
             w.refresh_active_preview_if(spec)
-            if changed:
-                w.request_autosave()
-        if changed:
-            self._notify_spec_changed(spec, previous)
+            w.request_autosave()
+        self._notify_spec_changed(spec, previous)
 
     def _on_item_clicked(self, item: QListWidgetItem):
         spec: ObjectSpec = item.data(Qt.UserRole)
@@ -2182,108 +3086,10 @@ class PaletteList(QListWidget):
     def _on_item_double_clicked(self, item: QListWidgetItem):
         spec: ObjectSpec = item.data(Qt.UserRole)
         previous = self._capture_spec_state(spec)
-        changed = False
-        # Edit default text
-        new_name, ok = QInputDialog.getText(self, "Edit default name", "Name:", text=spec.name)
-        if ok and new_name.strip():
-            final_name = new_name.strip()
-            if final_name != spec.name:
-                spec.name = final_name
-                changed = True
-        # Edit size
-        width, ok_w = QInputDialog.getInt(
-            self,
-            "Width",
-            "Width (cells):",
-            value=spec.size_w,
-            min=1,
-            max=GRID_CELLS,
-        )
-        height, ok_h = (spec.size_h, False)
-        if ok_w:
-            height, ok_h = QInputDialog.getInt(
-                self,
-                "Height",
-                "Height (cells):",
-                value=spec.size_h,
-                min=1,
-                max=GRID_CELLS,
-            )
-        if ok_w and ok_h:
-            if spec.size_w != width or spec.size_h != height:
-                spec.size_w = width
-                spec.size_h = height
-                changed = True
-        # Edit limit
-        limit_prompt_text = "" if spec.limit is None else str(spec.limit)
-        new_limit = spec.limit
-        new_limit_key = spec.limit_key or spec.name
-        limit_confirmed = False
-        while True:
-            limit_text, ok_limit = QInputDialog.getText(
-                self,
-                "Placement limit",
-                "Maximum placements (leave blank for unlimited):",
-                text=limit_prompt_text,
-            )
-            if not ok_limit:
-                break
-            limit_text = limit_text.strip()
-            if not limit_text:
-                new_limit = None
-                new_limit_key = spec.name
-                limit_confirmed = True
-                break
-            try:
-                parsed_limit = int(limit_text)
-            except ValueError:
-                QMessageBox.information(
-                    self,
-                    "Invalid limit",
-                    "Enter a whole number greater than zero or leave blank for no limit.",
-                )
-                continue
-            if parsed_limit <= 0:
-                QMessageBox.information(
-                    self,
-                    "Invalid limit",
-                    "Limit must be greater than zero or left blank to remove the cap.",
-                )
-                continue
-            new_limit = parsed_limit
-            limit_confirmed = True
-            break
-
-        if limit_confirmed and new_limit is not None:
-            key_prompt_text = spec.limit_key or spec.name
-            while True:
-                key_text, ok_key = QInputDialog.getText(
-                    self,
-                    "Shared limit key",
-                    "Objects sharing this key count toward the same limit:",
-                    text=key_prompt_text,
-                )
-                if not ok_key:
-                    limit_confirmed = False
-                    break
-                key_text = key_text.strip()
-                if not key_text:
-                    QMessageBox.information(
-                        self,
-                        "Invalid key",
-                        "Limit key cannot be blank when a limit is set.",
-                    )
-                    continue
-                new_limit_key = key_text
-                break
-
-        if limit_confirmed:
-            if spec.limit != new_limit:
-                spec.limit = new_limit
-                changed = True
-            if spec.limit_key != new_limit_key:
-                spec.limit_key = new_limit_key
-                changed = True
+        dialog = SpecEditDialog(spec, self, "Edit object")
+        if dialog.exec() != QDialog.Accepted:
+            return
+        changed = dialog.apply_to(spec)
         self._finalize_spec_change(item, spec, previous, changed)
 
     def _double_click_hits_icon(self, item: QListWidgetItem, event) -> bool:
@@ -2320,7 +3126,7 @@ class PaletteList(QListWidget):
 
     def _change_item_color(self, item: QListWidgetItem, spec: ObjectSpec) -> None:
         previous = self._capture_spec_state(spec)
-        color = QColorDialog.getColor(spec.fill, self, "Choose color")
+        color = choose_color(spec.fill, self, "Choose color")
         if color.isValid() and color != spec.fill:
             spec.fill = QColor(color)
             self._finalize_spec_change(item, spec, previous, True)
@@ -2377,11 +3183,16 @@ class ZoneList(QListWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAlternatingRowColors(True)
+        self._items: dict[MapZone, QListWidgetItem] = {}
         self.itemClicked.connect(self._on_item_clicked)
         self.itemDoubleClicked.connect(self._on_item_double_clicked)
 
+    def clear(self):
+        self._items.clear()
+        super().clear()
+
     def _zone_label(self, zone: MapZone) -> str:
-        return f"{zone.spec.name}  ({zone.spec.size_w}x{zone.spec.size_h})"
+        return zone.spec.label()
 
     def _zone_icon(self, zone: MapZone) -> QIcon:
         return create_zone_icon(zone.spec.fill, zone.spec.edge)
@@ -2395,24 +3206,30 @@ class ZoneList(QListWidget):
         item.setData(Qt.UserRole, zone)
         item.setIcon(self._zone_icon(zone))
         self.addItem(item)
+        self._items[zone] = item
 
     def remove_zone(self, zone: MapZone):
-        for i in range(self.count()):
-            item = self.item(i)
-            if item is None:
-                continue
-            if item.data(Qt.UserRole) is zone:
-                self.takeItem(i)
-                break
+        item = self._items.pop(zone, None)
+        if item is not None:
+            self.takeItem(self.row(item))
 
     def update_zone_item(self, zone: MapZone):
-        for i in range(self.count()):
-            item = self.item(i)
-            if item is None:
-                continue
-            if item.data(Qt.UserRole) is zone:
-                self._refresh_item(item, zone)
-                break
+        item = self._items.get(zone)
+        if item is not None:
+            self._refresh_item(item, zone)
+
+    def apply_zone_ops(self, ops: list[tuple[str, MapZone]]):
+        self.setUpdatesEnabled(False)
+        previous = self.blockSignals(True)
+        for op, zone in ops:
+            if op == "created":
+                self.add_zone(zone)
+            elif op == "updated":
+                self.update_zone_item(zone)
+            elif op == "removed":
+                self.remove_zone(zone)
+        self.blockSignals(previous)
+        self.setUpdatesEnabled(True)
 
     def _on_item_clicked(self, item: QListWidgetItem):
         zone: Optional[MapZone] = item.data(Qt.UserRole)
@@ -2422,23 +3239,14 @@ class ZoneList(QListWidget):
         if isinstance(scene, MapScene):
             scene.clearSelection()
             zone.setSelected(True)
-            for view in scene.views():
-                view.centerOn(zone)
-                break
+            if scene.primary_view is not None:
+                scene.primary_view.centerOn(zone)
 
     def _on_item_double_clicked(self, item: QListWidgetItem):
         zone: Optional[MapZone] = item.data(Qt.UserRole)
         if zone is None:
             return
-        new_name, ok = QInputDialog.getText(self, "Rename zone", "Name:", text=zone.spec.name)
-        if ok and new_name.strip():
-            zone.spec.name = new_name.strip()
-            zone.label_item.setText(zone.spec.name)
-            zone.updateLabelLayout()
-            scene = zone.scene()
-            if isinstance(scene, MapScene):
-                scene.zone_updated.emit(zone)
-        self.update_zone_item(zone)
+        zone._prompt_edit(self)
 
 
 class AddMemberDialog(QDialog):
@@ -2928,11 +3736,8 @@ class AllianceMembersTab(QWidget):
         color = member.rank_color()
         obj = member.map_object
         label = member.preferred_label()
-        obj.spec.name = label
-        obj.label_item.setText(label)
-        obj.updateLabelLayout()
-        obj.spec.fill = QColor(color)
-        obj.rect_item.setBrush(QBrush(obj.spec.fill))
+        obj.set_name(label)
+        obj.set_fill(color)
         obj._last_valid_pos = QPointF(obj.pos())
 
     def _handle_member_identity_change(self, member: MemberData):
@@ -3670,6 +4475,8 @@ class PaletteTabWidget(QTabWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Case-folded tab names, rebuilt lazily after tabs are added, removed or renamed
+        self._tab_names: Optional[set[str]] = None
         self.setMovable(True)
         self.tabBarDoubleClicked.connect(self._rename_category)
 
@@ -3712,8 +4519,8 @@ class PaletteTabWidget(QTabWidget):
             spec = widget.find_spec_by_template(template_id)
             if spec is None:
                 continue
-            previous_fill = QColor(spec.fill)
-            if spec.fill != color:
+            previous_fill = spec.fill.rgba()
+            if previous_fill != color.rgba():
                 spec.fill = QColor(color)
                 widget.refresh_spec_item(spec)
                 previous = {"name": spec.name, "fill": previous_fill}
@@ -3792,7 +4599,7 @@ class PaletteTabWidget(QTabWidget):
         if not ok_h:
             return
 
-        color = QColorDialog.getColor(QColor(Qt.lightGray), self, "Choose color")
+        color = choose_color(QColor(Qt.lightGray), self, "Choose color")
         if color.isValid():
             fill = QColor(color)
         else:
@@ -3827,15 +4634,24 @@ class PaletteTabWidget(QTabWidget):
             QMessageBox.information(self, "Category exists", f"Category '{name}' already exists.")
             return
         self.setTabText(index, name)
+        self._tab_names = None
         window = self.window()
         if isinstance(window, MainWindow):
             window.request_autosave()
 
+    def tabInserted(self, index: int) -> None:
+        super().tabInserted(index)
+        self._tab_names = None
+
+    def tabRemoved(self, index: int) -> None:
+        super().tabRemoved(index)
+        self._tab_names = None
+
     def _category_exists(self, name: str) -> bool:
-        for i in range(self.count()):
-            if self.tabText(i).lower() == name.lower():
-                return True
-        return False
+        names = self._tab_names
+        if names is None:
+            names = self._tab_names = {self.tabText(i).casefold() for i in range(self.count())}
+        return name.casefold() in names
 
 
 # ----------------------------- Main Window -----------------------------
@@ -3847,6 +4663,15 @@ class MainWindow(QMainWindow):
         self._autosave_timer.setSingleShot(True)
         self._autosave_timer.setInterval(750)
         self._autosave_timer.timeout.connect(self._perform_autosave)
+        # Mouse moves over the map are coalesced to at most one update per frame
+        self._last_move_pos: Optional[QPoint] = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._flush_move)
+        self._last_coord = (-1, -1)
+        self._coord_fmt = "x: %d, y: %d".__mod__
+        self._last_hover_cell: Optional[tuple] = None
         self._storage_root = Path.cwd()
         self._save_root = self._storage_root / "saves"
         self._export_root = self._storage_root / "exports"
@@ -3899,7 +4724,9 @@ class MainWindow(QMainWindow):
         # Scene & View
         self.scene = MapScene(GRID_CELLS, CELL_SIZE, self)
         self.view = MapView(self.scene, self)
+        self.scene.primary_view = self.view
         self.setCentralWidget(self.view)
+        self._cache_scene_metrics()
         self.active_member: Optional[MemberData] = None
         self._active_member_spec: Optional[ObjectSpec] = None
         self._cell_size_range = (5, 120)
@@ -3929,10 +4756,14 @@ class MainWindow(QMainWindow):
         # Status bar with coordinates + hint
         self.coord_label = QLabel("x: -, y: -")
         self.hint_label = QLabel("")
+        self._hint_text = ""
+        # Shared colour picker, built on first use and reused for every edit
+        self._color_dialog: Optional[QColorDialog] = None
         self.statusBar().addPermanentWidget(self.coord_label)
         self.statusBar().addPermanentWidget(self.hint_label)
         self.view.setMouseTracking(True)
-        self.view.viewport().installEventFilter(self)
+        self._viewport = self.view.viewport()
+        self._viewport.installEventFilter(self)
 
         # Toolbar actions
         toolbar = QToolBar("Tools", self)
@@ -3965,6 +4796,7 @@ class MainWindow(QMainWindow):
         self.scene.zone_created.connect(self._handle_zone_created)
         self.scene.zone_updated.connect(self._handle_zone_updated)
         self.scene.zone_removed.connect(self._handle_zone_removed)
+        self.scene.zones_bulk.connect(self._handle_zones_bulk)
         self.scene.zone_redraw_finished.connect(self._on_zone_redraw_finished)
         self.scene.object_placed.connect(self._on_object_placed)
         self.scene.object_removed.connect(self._on_object_removed)
@@ -3980,7 +4812,7 @@ class MainWindow(QMainWindow):
             self._active_member_spec = None
         self.set_zone_draw_mode(False)
         self.scene.set_active_spec(spec)
-        self.hint_label.setText(
+        self._set_hint(
             f"Placing {spec.name}: Left-click to place, Shift+Click for multiple, Right-click to cancel"
         )
 
@@ -3989,19 +4821,20 @@ class MainWindow(QMainWindow):
         self._active_member_spec = spec
         self.activate_placement(spec, clear_member=False)
         self.active_member = member
-        self.hint_label.setText(
+        self._set_hint(
             f"Placing {member.display_name()} ({member.rank}): Left-click to place, Right-click to cancel"
         )
 
     def set_zone_draw_mode(self, enabled: bool):
+        if self.scene.zone_draw_mode == enabled and self.act_draw_zone.isChecked() == enabled:
+            return
         if enabled:
             if self.scene.active_spec is not None:
                 self.scene.cancel_placement()
         self.scene.set_zone_draw_mode(enabled)
         if enabled:
-            views = self.scene.views()
-            if views:
-                view = views[0]
+            view = self.scene.primary_view
+            if view is not None:
                 cursor_pos = view.mapFromGlobal(QCursor.pos())
                 if view.rect().contains(cursor_pos):
                     scene_pos = view.mapToScene(cursor_pos)
@@ -4010,7 +4843,7 @@ class MainWindow(QMainWindow):
         self.act_draw_zone.setChecked(enabled)
         self.act_draw_zone.blockSignals(previous)
         if enabled:
-            self.hint_label.setText(
+            self._set_hint(
                 "Draw zone: Click and drag to create a zone. Right-click to cancel or exit the tool"
             )
         elif self.scene.active_spec is None:
@@ -4021,10 +4854,9 @@ class MainWindow(QMainWindow):
             self.set_zone_draw_mode(True)
         self.scene.prepare_zone_redraw(zone)
         zone.setSelected(True)
-        for view in self.scene.views():
-            view.centerOn(zone)
-            break
-        self.hint_label.setText(
+        if self.scene.primary_view is not None:
+            self.scene.primary_view.centerOn(zone)
+        self._set_hint(
             "Redraw zone: Click and drag to define the new area. Right-click to cancel."
         )
 
@@ -4040,6 +4872,10 @@ class MainWindow(QMainWindow):
         self.zone_list.remove_zone(zone)
         self.request_autosave()
 
+    def _handle_zones_bulk(self, ops: list):
+        self.zone_list.apply_zone_ops(ops)
+        self.request_autosave()
+
     def _on_zone_redraw_finished(self, zone: MapZone):
         self.set_zone_draw_mode(False)
         zone.setSelected(True)
@@ -4064,10 +4900,9 @@ class MainWindow(QMainWindow):
         self.request_autosave()
 
     def offer_apply_spec_changes(self, spec: ObjectSpec, previous: dict):
-        matching: list[MapObject] = []
-        for item in self.scene.items():
-            if isinstance(item, MapObject) and item.spec.template_id == spec.template_id:
-                matching.append(item)
+        matching = [
+            item for item in self.scene.map_objects if item.spec.template_id == spec.template_id
+        ]
         if not matching:
             return
         response = QMessageBox.question(
@@ -4084,11 +4919,8 @@ class MainWindow(QMainWindow):
         )
         failed = False
         for obj in matching:
-            obj.spec.name = spec.name
-            obj.label_item.setText(spec.name)
-            obj.updateLabelLayout()
-            obj.spec.fill = QColor(spec.fill)
-            obj.rect_item.setBrush(QBrush(obj.spec.fill))
+            obj.set_name(spec.name)
+            obj.set_fill(spec.fill)
             obj.spec.limit = spec.limit
             obj.spec.limit_key = spec.limit_key
             if size_changed:
@@ -4096,17 +4928,16 @@ class MainWindow(QMainWindow):
                 old_h = obj.spec.size_h
                 obj.spec.size_w = spec.size_w
                 obj.spec.size_h = spec.size_h
-                w_px = spec.size_w * self.scene.cell_size
-                h_px = spec.size_h * self.scene.cell_size
-                obj.rect_item.setRect(0, 0, w_px, h_px)
-                obj.updateLabelLayout()
+                obj.cell_size = self.scene.cell_size
+                obj.apply_size()
                 self.scene.snap_items_to_grid([obj])
+                self.scene._reindex_object(obj)
                 if not self.scene.is_object_position_free(obj):
                     obj.spec.size_w = old_w
                     obj.spec.size_h = old_h
-                    obj.rect_item.setRect(0, 0, old_w * self.scene.cell_size, old_h * self.scene.cell_size)
-                    obj.updateLabelLayout()
+                    obj.apply_size()
                     self.scene.snap_items_to_grid([obj])
+                    self.scene._reindex_object(obj)
                     failed = True
                 else:
                     obj._last_valid_pos = QPointF(obj.pos())
@@ -4118,13 +4949,18 @@ class MainWindow(QMainWindow):
                 "Resize blocked",
                 "Some objects could not be resized because they would overlap other items.",
             )
-        self.scene.update()
+        self.scene.update_visible()
 
     def remove_objects_for_spec(self, spec: ObjectSpec) -> int:
         return self.scene.remove_objects_by_template(spec.template_id)
 
+    def _set_hint(self, text: str) -> None:
+        if text != self._hint_text:
+            self._hint_text = text
+            self.hint_label.setText(text)
+
     def clear_placement_hint(self):
-        self.hint_label.setText("")
+        self._set_hint("")
 
     def cancel_active_placement(self):
         any_cancelled = False
@@ -4140,11 +4976,14 @@ class MainWindow(QMainWindow):
             self.clear_placement_hint()
 
     def toggle_grid(self, checked: bool):
+        if checked == self.scene.show_grid:
+            return
         self.scene.show_grid = checked
-        if hasattr(self.scene, "grid_item"):
+        if self.scene.grid_item is not None:
+            # setVisible schedules the repaint of the grid's area
             self.scene.grid_item.setVisible(checked)
-            self.scene.grid_item.update()
-        self.scene.update()
+        if not checked:
+            self.scene.clear_grid_tiles()
         self.request_autosave()
 
     def change_cell_size(self, value: int):
@@ -4153,45 +4992,67 @@ class MainWindow(QMainWindow):
             return
 
         # Rescale scene: update cell size, scene rect, and items
+        old_v = self.scene.cell_size
         self.scene.cell_size = v
         size_px = self.scene.cells * v
         self.scene.setSceneRect(0, 0, size_px, size_px)
-        if hasattr(self.scene, "grid_item"):
+        self._cache_scene_metrics()
+        if self.scene.grid_item is not None:
             self.scene.grid_item.update_geometry()
-            self.scene.grid_item.update()
-        # Update existing items
-        for item in self.scene.items():
-            if isinstance(item, MapObject):
-                item.cell_size = v
-                w = item.spec.size_w * v
-                h = item.spec.size_h * v
-                item.rect_item.setRect(0, 0, w, h)
-                item.updateLabelLayout()
-                top_left = item.pos()
-                snapped_x = round(top_left.x() / v) * v
-                snapped_y = round(top_left.y() / v) * v
-                clamped = self.scene._clamp_top_left(snapped_x, snapped_y, w, h)
-                item.setPos(clamped)
-            elif isinstance(item, MapZone):
-                item.cell_size = v
-                w = item.spec.size_w * v
-                h = item.spec.size_h * v
-                item.rect_item.setRect(0, 0, w, h)
-                item.updateLabelLayout()
-                top_left = item.pos()
-                snapped_x = round(top_left.x() / v) * v
-                snapped_y = round(top_left.y() / v) * v
-                clamped = self.scene._clamp_top_left(snapped_x, snapped_y, w, h)
-                item.setPos(clamped)
-                item._update_handles_geometry()
-                item._update_handle_colors()
-            elif isinstance(item, PreviewObject):
-                item.update_for_cell_size(v)
-        self.scene.update()
+        # One visible-area repaint below covers the grid and every rescaled item
+        with self.scene.batched_updates():
+            # Update existing items; clamp bounds are fixed for the whole pass and
+            # pixel sizes are shared by every item with the same footprint
+            cells = self.scene.cells
+            for (size_w, size_h), items in group_by_footprint(self.scene.map_objects).items():
+                self._rescale_items(items, old_v, v, size_w, size_h, cells)
+            for (size_w, size_h), items in group_by_footprint(self.scene.map_zones).items():
+                self._rescale_items(items, old_v, v, size_w, size_h, cells)
+                for item in items:
+                    item._update_handles_geometry()
+                    item._update_handle_colors()
+            if self.scene.preview_item is not None:
+                self.scene.preview_item.update_for_cell_size(v)
+                self.scene.bind_preview_update()
+            self.scene._detail_visibility_dirty = True
+        self.scene.update_visible()
         self.scene.update_zone_draw_visuals()
-        self.scene.update_detail_visibility()
         self.request_autosave()
 
+    @staticmethod
+    def _rescale_items(
+        items: list, old_v: int, v: int, size_w: int, size_h: int, cells: int
+    ) -> None:
+        # Items keep their cell: positions are read in old cells and written in
+        # new ones with integer clamps; footprint and bounds are shared by the group
+        max_cx = max(0, cells - size_w)
+        max_cy = max(0, cells - size_h)
+        for item in items:
+            item.cell_size = v
+            item.apply_size()
+            top_left = item.pos()
+            x = top_left.x()
+            y = top_left.y()
+            cx = round(x / old_v)
+            cy = round(y / old_v)
+            if cx > max_cx:
+                cx = max_cx
+            elif cx < 0:
+                cx = 0
+            if cy > max_cy:
+                cy = max_cy
+            elif cy < 0:
+                cy = 0
+            if cx * v != x or cy * v != y:
+                item.setPos(cx * v, cy * v)
+
+    def _cache_scene_metrics(self):
+        # Read on every mouse move; only change_cell_size alters them
+        self._cs = self.scene.cell_size
+        self._cells = self.scene.cells
+        self._sw = self._cells * self._cs
+        self._sh = self._sw
+
     def change_detail_threshold(self, threshold: int):
         threshold = int(
             max(self._detail_threshold_range[0], min(self._detail_threshold_range[1], threshold))
@@ -4214,6 +5075,26 @@ class MainWindow(QMainWindow):
         self.change_cell_size(cell_size)
         self.change_detail_threshold(threshold)
 
+    def pick_color(
+        self, initial: QColor, title: str, parent: Optional[QWidget] = None
+    ) -> QColor:
+        dialog = self._color_dialog
+        if dialog is None:
+            dialog = self._color_dialog = QColorDialog(self)
+        dialog.setWindowTitle(title)
+        dialog.setCurrentColor(initial)
+        # Stack and centre over the window that asked, e.g. an open edit dialog
+        owner = parent.window() if parent is not None else self
+        if owner is not self:
+            dialog.setParent(owner, dialog.windowFlags())
+        try:
+            if dialog.exec() != QDialog.Accepted:
+                return QColor()
+            return dialog.selectedColor()
+        finally:
+            if owner is not self:
+                dialog.setParent(self, dialog.windowFlags())
+
     def request_autosave(self):
         if self._loading_state:
             return
@@ -4284,9 +5165,7 @@ class MainWindow(QMainWindow):
         tags_data = self.alliance_widget.tags_tab.serialized_tags()
 
         objects_data = []
-        for item in self.scene.items():
-            if not isinstance(item, MapObject):
-                continue
+        for item in self.scene.map_objects:
             spec = item.spec
             objects_data.append(
                 {
@@ -4304,7 +5183,7 @@ class MainWindow(QMainWindow):
             )
 
         zones_data = []
-        for zone in list(getattr(self.scene, "_zones", [])):
+        for zone in list(self.scene.map_zones):
             zones_data.append(
                 {
                     "spec": {
@@ -4418,7 +5297,7 @@ class MainWindow(QMainWindow):
             target_rect = QRectF(0, 0, source_rect.width(), source_rect.height())
             if target_rect.isEmpty():
                 target_rect = QRectF(0, 0, float(width), float(height))
-            self.scene.render(painter, target_rect, source_rect)
+            self.scene.render_uncached(painter, target_rect, source_rect)
         finally:
             if painter is not None:
                 painter.end()
@@ -4459,7 +5338,7 @@ class MainWindow(QMainWindow):
         try:
             painter = QPainter(image)
             target_rect = QRectF(0, 0, float(width), float(height))
-            self.scene.render(painter, target_rect, source_rect)
+            self.scene.render_uncached(painter, target_rect, source_rect)
         finally:
             if painter is not None:
                 painter.end()
@@ -4587,7 +5466,7 @@ class MainWindow(QMainWindow):
         finally:
             self._loading_state = previous_state
 
-        self.scene.update()
+        self.scene.update_visible()
         self.scene.update_zone_draw_visuals()
         if not autosave:
             self._current_file_path = path
@@ -4625,8 +5504,8 @@ class MainWindow(QMainWindow):
         self._load_autosave(show_message=True)
 
     def _clear_scene_items(self):
-        for item in list(self.scene.items()):
-            if isinstance(item, (MapObject, MapZone)):
+        with self.scene.batched_updates():
+            for item in self.scene.map_objects + self.scene.map_zones:
                 self.scene.remove_map_item(item)
 
     def _clear_palette_tabs(self):
@@ -4753,28 +5632,29 @@ class MainWindow(QMainWindow):
         if not isinstance(objects_data, list):
             objects_data = []
         members_tab = self.alliance_widget.members_tab
-        for entry in objects_data:
-            spec_info = entry.get("spec", {})
-            spec = self._create_spec_from_serialized(spec_info)
-            pos = entry.get("pos", [0, 0])
-            try:
-                x = float(pos[0])
-                y = float(pos[1])
-            except (TypeError, ValueError, IndexError):
-                x, y = 0.0, 0.0
-            top_left = QPointF(x, y)
-            obj = MapObject(spec, top_left, self.scene.cell_size)
-            self.scene.addItem(obj)
-            obj.setPos(top_left)
-            obj.updateLabelLayout()
-            obj._last_valid_pos = QPointF(obj.pos())
-            template_id = getattr(spec, "template_id", "")
-            if template_id and template_id.startswith("member:"):
-                members_tab.handle_member_object_placed(template_id, obj)
+        with self.scene.batched_updates():
+            for entry in objects_data:
+                spec_info = entry.get("spec", {})
+                spec = self._create_spec_from_serialized(spec_info)
+                pos = entry.get("pos", [0, 0])
+                try:
+                    x = float(pos[0])
+                    y = float(pos[1])
+                except (TypeError, ValueError, IndexError):
+                    x, y = 0.0, 0.0
+                top_left = QPointF(x, y)
+                obj = self.scene.create_map_object(spec, top_left)
+                self.scene.add_map_object(obj)
+                obj.setPos(top_left)
+                obj.updateLabelLayout()
+                obj._last_valid_pos = QPointF(obj.pos())
+                template_id = getattr(spec, "template_id", "")
+                if template_id and template_id.startswith("member:"):
+                    members_tab.handle_member_object_placed(template_id, obj)
         self.scene.update_detail_visibility()
 
     def _apply_zones_data(self, zones_data: list[dict], zone_counter: Optional[int]):
-        self.scene._zones = []
+        self.scene.map_zones = []
         self.zone_list.clear()
         if not isinstance(zones_data, list):
             self.scene._zone_counter = int(zone_counter or 0)
@@ -4783,7 +5663,7 @@ class MainWindow(QMainWindow):
             spec_info = entry.get("spec", {})
             fill = color_from_hex(spec_info.get("fill"), QColor(DEFAULT_ZONE_FILL))
             edge = color_from_hex(spec_info.get("edge"), QColor(DEFAULT_ZONE_EDGE))
-            name = spec_info.get("name", f"Zone {len(self.scene._zones) + 1}")
+            name = spec_info.get("name", f"Zone {len(self.scene.map_zones) + 1}")
             spec = ZoneSpec(
                 name,
                 int(spec_info.get("size_w", 1)),
@@ -4803,14 +5683,14 @@ class MainWindow(QMainWindow):
             zone.setPos(top_left)
             zone.updateLabelLayout()
             zone._update_handles_geometry()
-            self.scene._zones.append(zone)
+            self.scene.map_zones.append(zone)
             self.zone_list.add_zone(zone)
         counter = 0
         try:
             counter = int(zone_counter) if zone_counter is not None else 0
         except (TypeError, ValueError):
             counter = 0
-        counter = max(counter, len(self.scene._zones))
+        counter = max(counter, len(self.scene.map_zones))
         self.scene._zone_counter = counter
         self.scene.update_detail_visibility()
 
@@ -4851,34 +5731,74 @@ class MainWindow(QMainWindow):
 
     def eventFilter(self, watched, event):
         # Show bottom-left-origin coordinates under cursor and drive preview visibility/position
-        if watched is self.view.viewport():
-            if event.type() == QEvent.MouseMove:
-                p = event.position()
-                scene_pos = self.view.mapToScene(int(p.x()), int(p.y()))
-                cs = self.scene.cell_size
-                cells = self.scene.cells
-                x_raw = max(0.0, min(self.scene.scene_width(), float(scene_pos.x())))
-                y_raw = max(0.0, min(self.scene.scene_height(), float(scene_pos.y())))
-                # 0-based X, bottom-left-origin Y (invert Y)
-                cx = int(x_raw // cs)
-                cy = int((self.scene.scene_height() - y_raw) // cs)
-                cx = max(0, min(cells - 1, cx))
-                cy = max(0, min(cells - 1, cy))
-                self.coord_label.setText(f"x: {cx}, y: {cy}")
-                self.scene.update_preview(scene_pos)
-                self.scene.update_zone_hover(scene_pos)
-            elif event.type() == QEvent.Leave:
-                if self.scene.preview_item is not None:
-                    self.scene.preview_item.setVisible(False)
+        if watched is self._viewport:
+            etype = event.type()
+            if etype == QEvent.MouseMove:
+                # Only the viewport position is kept; mapping waits for the flush
+                self._last_move_pos = event.position().toPoint()
+                if not self._move_timer.isActive():
+                    self._move_timer.start()
+            elif etype == QEvent.Leave:
+                self._move_timer.stop()
+                self._last_move_pos = None
+                preview = self.scene.preview_item
+                if preview is not None and preview.isVisible():
+                    preview.setVisible(False)
                 if self.scene.zone_draw_mode:
                     self.scene.hide_zone_hover()
-            elif event.type() == QEvent.Enter:
-                if self.scene.preview_item is not None:
-                    self.scene.preview_item.setVisible(True)
+            elif etype == QEvent.Enter:
+                preview = self.scene.preview_item
+                if preview is not None and not preview.isVisible():
+                    preview.setVisible(True)
                 if self.scene.zone_draw_mode:
                     self.scene.show_zone_hover()
         return super().eventFilter(watched, event)
 
+    def _flush_move(self):
+        view_pos = self._last_move_pos
+        if view_pos is None:
+            return
+        self._last_move_pos = None
+        scene_pos = self.view.mapToScene(view_pos)
+        cs = self._cs
+        sw = self._sw
+        sh = self._sh
+        x = scene_pos.x()
+        y = scene_pos.y()
+        x_i = int(x)
+        y_i = int(y)
+        if x_i < 0:
+            x_i = 0
+        elif x_i >= sw:
+            x_i = sw - 1
+        if y_i < 0:
+            y_i = 0
+        elif y_i >= sh:
+            y_i = sh - 1
+        # 0-based X, bottom-left-origin Y (invert Y)
+        cx = x_i // cs
+        cy = (sh - 1 - y_i) // cs
+        if (cx, cy) != self._last_coord:
+            self._last_coord = coord = (cx, cy)
+            self.coord_label.setText(self._coord_fmt(coord))
+        sc = self.scene
+        placing = sc.active_spec is not None
+        drawing = sc.zone_draw_mode
+        if not (placing or drawing):
+            return
+        # Snapping rounds at cell edges and at cell centres (even-sized objects,
+        # zone corners), so track half cells. The key also covers anything that
+        # changes the snapped result while the cursor stays put.
+        hover_key = (math.floor(x * 2) // cs, math.floor(y * 2) // cs, cs, sc._preview_update, drawing)
+        if hover_key != self._last_hover_cell:
+            self._last_hover_cell = hover_key
+            if placing:
+                sc.update_preview(scene_pos)
+            if drawing:
+                sc.update_zone_hover(scene_pos)
+                if sc.is_drawing_zone():
+                    sc.update_zone_draw(scene_pos)
+
 
 def main():
     app = QApplication(sys.argv)